@@ -2,29 +2,39 @@
 """
 Simple script to run the Lead Agent API server.
 This is a convenience script for development and testing.
+
+The server runs in this interpreter by default. Pass ``--reload`` to
+restart it on code changes and ``--debug`` for debug logging.
 """
 
+import argparse
 import sys
-import subprocess
 from pathlib import Path
 
 
 def main():
     """Run the Lead Agent API server with default settings."""
+    parser = argparse.ArgumentParser(description="Run the Lead Agent API server")
+    parser.add_argument(
+        "--reload", 
+        action="store_true", 
+        help="Enable auto-reload for development"
+    )
+    parser.add_argument(
+        "--debug", 
+        action="store_true", 
+        help="Enable debug mode"
+    )
+    args = parser.parse_args()
+    
     # Check if we're in the correct directory
     if not Path("src/lead_agent").exists():
         print("Error: Please run this script from the project root directory.")
         print("Expected to find 'src/lead_agent' directory.")
         sys.exit(1)
     
-    # Default arguments
-    args = [
-        sys.executable, "-m", "lead_agent.api.server",
-        "--host", "127.0.0.1",
-        "--port", "8000",
-        "--reload",  # Enable auto-reload for development
-        "--debug"    # Enable debug mode
-    ]
+    # uvloop is not available on Windows
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
     
     print("🚀 Starting Lead Agent API Server...")
     print("📍 URL: http://127.0.0.1:8000")
@@ -36,8 +46,24 @@ def main():
     print("-" * 50)
     
     try:
+        import uvicorn
+        
+        if args.reload:
+            # The reloader re-imports the app in a worker process on changes,
+            # so it needs the app as an import string
+            app = "lead_agent.api.server:app"
+        else:
+            from lead_agent.api.server import app
+        
         # Run the server
-        subprocess.run(args)
+        uvicorn.run(
+            app,
+            host="127.0.0.1",
+            port=8000,
+            reload=args.reload,
+            log_level="debug" if args.debug else "info",
+            loop=loop
+        )
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
     except Exception as e:
@@ -1,14 +1,30 @@
 """Agent communication module."""
 
+import importlib
+from typing import Any
+
 from .base import BaseAgent, AgentFactory
-from .ai_agent import AIAgent
-from .mcp_server import MCPServerAgent
-from .http_api import HTTPAPIAgent
+
+# Agent implementations are imported on first access so that importing this
+# package does not pull in aiohttp
+_LAZY_AGENTS = {
+    "AIAgent": ".ai_agent",
+    "MCPServerAgent": ".mcp_server",
+    "HTTPAPIAgent": ".http_api",
+}
 
 __all__ = [
     "BaseAgent",
-    "AgentFactory", 
+    "AgentFactory",
     "AIAgent",
     "MCPServerAgent",
     "HTTPAPIAgent"
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import agent implementations on first access."""
+    module = _LAZY_AGENTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
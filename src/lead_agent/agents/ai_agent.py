@@ -1,12 +1,13 @@
 """AI Agent implementation."""
 
+import asyncio
 import json
 from typing import Any, Dict
 
-import aiohttp
+import orjson
 
-from ..models import AgentConfig, AgentResponse, AgentType
-from .base import BaseAgent, AgentFactory
+from ..models import AgentConfig, AgentResponse
+from .base import BaseAgent
 
 
 class AIAgent(BaseAgent):
@@ -22,54 +23,43 @@ class AIAgent(BaseAgent):
         Returns:
             AgentResponse: Response from the AI agent
         """
+        import aiohttp
+        
+        # Prepare the request payload
+        payload = {
+            "action": action,
+            "parameters": parameters,
+            **self.config.custom_params
+        }
+        
+        session = await self._get_session()
+        
+        # Only the network round-trip can raise the errors handled below;
+        # anything else propagates to the retry and circuit breaker logic
         try:
-            # Prepare the request payload
-            payload = {
-                "action": action,
-                "parameters": parameters,
-                **self.config.custom_params
-            }
-            
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            # Add authentication if configured
-            if self.config.authentication:
-                auth_type = self.config.authentication.get("type")
-                if auth_type == "bearer":
-                    token = self.config.authentication.get("token")
-                    headers["Authorization"] = f"Bearer {token}"
-                elif auth_type == "api_key":
-                    key = self.config.authentication.get("key")
-                    key_header = self.config.authentication.get("header", "X-API-Key")
-                    headers[key_header] = key
-            
-            # Make HTTP request to AI service
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.config.endpoint,
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-                ) as response:
-                    
-                    if response.status == 200:
-                        result = await response.json()
-                        return AgentResponse(
-                            success=True,
-                            result=result,
-                            metadata={"status_code": response.status}
-                        )
-                    else:
-                        error_text = await response.text()
-                        return AgentResponse(
-                            success=False,
-                            error=f"HTTP {response.status}: {error_text}",
-                            metadata={"status_code": response.status}
-                        )
+            async with session.post(
+                self.config.endpoint,
+                json=payload,
+                headers=self._base_headers,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+            ) as response:
+                
+                if response.status == 200:
+                    result = await response.json(loads=orjson.loads)
+                    return AgentResponse(
+                        success=True,
+                        result=result,
+                        metadata={"status_code": response.status}
+                    )
+                else:
+                    error_text = await response.text()
+                    return AgentResponse(
+                        success=False,
+                        error=f"HTTP {response.status}: {error_text}",
+                        metadata={"status_code": response.status}
+                    )
                         
-        except aiohttp.ClientTimeout:
+        except asyncio.TimeoutError:
             return AgentResponse(
                 success=False,
                 error="Request timeout"
@@ -84,12 +74,3 @@ class AIAgent(BaseAgent):
                 success=False,
                 error=f"Invalid JSON response: {str(e)}"
             )
-        except Exception as e:
-            return AgentResponse(
-                success=False,
-                error=f"Unexpected error: {str(e)}"
-            )
-
-
-# Register the agent type
-AgentFactory.register_agent_type(AgentType.AI_AGENT, AIAgent)
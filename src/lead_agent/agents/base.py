@@ -3,17 +3,135 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
+import importlib.util
 import time
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Type
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple, Type, Union
+)
+from urllib.parse import urljoin
 
 from ..models import AgentConfig, AgentResponse, AgentType
 from ..patterns.circuit_breaker import CircuitBreaker
 from ..patterns.retry import RetryHandler
 
+if TYPE_CHECKING:
+    import aiohttp
+    import httpx
 
-class BaseAgent(ABC):
-    """Abstract base class for all agents."""
+# asyncio.timeout() is only available on Python 3.11+
+_HAS_ASYNCIO_TIMEOUT = hasattr(asyncio, "timeout")
+
+# HTTP/2 needs the optional httpx and h2 packages
+HTTP2_AVAILABLE = (
+    importlib.util.find_spec("httpx") is not None
+    and importlib.util.find_spec("h2") is not None
+)
+
+AuthResult = Tuple[Dict[str, str], Optional["aiohttp.BasicAuth"]]
+
+
+def _bearer_auth(authentication: Dict[str, Any]) -> AuthResult:
+    """Build headers for bearer token authentication."""
+    token = authentication.get("token")
+    return {"Authorization": f"Bearer {token}"}, None
+
+
+def _api_key_auth(authentication: Dict[str, Any]) -> AuthResult:
+    """Build headers for API key authentication."""
+    key = authentication.get("key")
+    key_header = authentication.get("header", "X-API-Key")
+    return {key_header: key}, None
+
+
+def _basic_auth(authentication: Dict[str, Any]) -> AuthResult:
+    """Build credentials for HTTP basic authentication."""
+    import aiohttp
+    
+    username = authentication.get("username")
+    password = authentication.get("password")
+    return {}, aiohttp.BasicAuth(username, password)
+
+
+def _no_auth(authentication: Dict[str, Any]) -> AuthResult:
+    """Handle missing or unknown authentication types."""
+    return {}, None
+
+
+async def _close_client(
+    close: Callable[[], Awaitable[None]],
+    loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Close a shared HTTP client, possibly created on another event loop.
+    
+    A client's connections belong to the loop it was created on, so they
+    are closed there if that loop is still running elsewhere. Once the loop
+    is closed its transports cannot be closed any more, but the client is
+    still marked closed.
+    
+    Args:
+        close: Coroutine function closing the client
+        loop: Event loop the client was created on
+    """
+    if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+        asyncio.run_coroutine_threadsafe(close(), loop)
+        return
+    try:
+        await close()
+    except RuntimeError:
+        # Raised for transports whose event loop is closed
+        if loop is None or not loop.is_closed():
+            raise
+
+
+def _lru_get(cache: "OrderedDict[Any, Any]", key: Any, size: int, create: Callable[[], Any]) -> Any:
+    """Get an entry from a bounded LRU cache, creating it if it is missing.
+    
+    Args:
+        cache: Cache ordered from least to most recently used
+        key: Cache key
+        size: Maximum number of entries kept
+        create: Factory for a missing entry
+        
+    Returns:
+        The cached or newly created entry
+    """
+    entry = cache.get(key)
+    if entry is None:
+        entry = cache[key] = create()
+        if len(cache) > size:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return entry
+
+
+# Authentication handlers keyed by the configured "type"
+_AUTH_HANDLERS: Dict[str, Callable[[Dict[str, Any]], AuthResult]] = {
+    "bearer": _bearer_auth,
+    "api_key": _api_key_auth,
+    "basic": _basic_auth,
+}
+
+
+class BaseAgent:
+    """Base class for all agents."""
+    
+    # HTTP session shared by all agents so connections are pooled and kept alive
+    _session: Optional[aiohttp.ClientSession] = None
+    _session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    # HTTP/2 client for agents that opt in, multiplexing calls per host
+    _http2_client: Optional[httpx.AsyncClient] = None
+    _http2_client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    # Resilience state shared by agents that talk to the same endpoint,
+    # keyed by (endpoint, frozen settings) and bounded like the config cache
+    _circuit_breakers: "OrderedDict[tuple, CircuitBreaker]" = OrderedDict()
+    _retry_handlers: "OrderedDict[tuple, RetryHandler]" = OrderedDict()
+    _shared_state_size = 256
     
     def __init__(self, config: AgentConfig):
         """Initialize the agent.
@@ -22,21 +140,101 @@ class BaseAgent(ABC):
             config: Agent configuration
         """
         self.config = config
-        self.circuit_breaker = CircuitBreaker(config.circuit_breaker)
-        self.retry_handler = RetryHandler(config.retry_config)
+        self.circuit_breaker = self._get_circuit_breaker(config)
+        self.retry_handler = self._get_retry_handler(config)
+        self._base_headers: Mapping[str, str] = MappingProxyType({})
+        self._basic_auth: Optional[aiohttp.BasicAuth] = None
+        # Directory that urljoin resolves plain relative paths against, so
+        # they can be appended directly; None when only urljoin is reliable
+        if not config.endpoint:
+            self._endpoint_base: Optional[str] = ""
+        elif config.endpoint.startswith(("http://", "https://")):
+            self._endpoint_base = urljoin(config.endpoint, ".")
+        else:
+            self._endpoint_base = None
+        self._build_auth()
+    
+    def _build_auth(self) -> None:
+        """Precompute request headers and credentials from the configuration.
+        
+        The authentication settings do not change for the lifetime of an
+        agent, so they are interpreted once instead of on every request.
+        Content-Type is left out, aiohttp sets it for requests sent with
+        ``json=``.
+        """
+        authentication = self.config.authentication or {}
+        handler = _AUTH_HANDLERS.get(authentication.get("type"), _no_auth)
+        auth_headers, self._basic_auth = handler(authentication)
+        # Shared by every request, so it is made read-only
+        self._base_headers = MappingProxyType(auth_headers)
+    
+    @classmethod
+    def _get_circuit_breaker(cls, config: AgentConfig) -> CircuitBreaker:
+        """Get the circuit breaker for an agent configuration.
+        
+        Agents with the same endpoint and circuit breaker settings share one
+        breaker, so its state reflects the health of the upstream service
+        across agent instances and workflow runs. Only the most recently
+        used breakers are kept, so the registry stays bounded.
+        
+        Args:
+            config: Agent configuration
+            
+        Returns:
+            CircuitBreaker: Circuit breaker for the agent
+        """
+        if not config.endpoint:
+            return CircuitBreaker(config.circuit_breaker)
+        
+        return _lru_get(
+            BaseAgent._circuit_breakers,
+            (config.endpoint, config.circuit_breaker),
+            BaseAgent._shared_state_size,
+            lambda: CircuitBreaker(config.circuit_breaker)
+        )
+    
+    @classmethod
+    def _get_retry_handler(cls, config: AgentConfig) -> RetryHandler:
+        """Get the retry handler for an agent configuration.
+        
+        Args:
+            config: Agent configuration
+            
+        Returns:
+            RetryHandler: Retry handler for the agent
+        """
+        if not config.endpoint:
+            return RetryHandler(config.retry_config)
+        
+        return _lru_get(
+            BaseAgent._retry_handlers,
+            (config.endpoint, config.retry_config),
+            BaseAgent._shared_state_size,
+            lambda: RetryHandler(config.retry_config)
+        )
+    
+    @classmethod
+    def reset_shared_state(cls) -> None:
+        """Forget the circuit breakers and retry handlers shared by endpoint."""
+        BaseAgent._circuit_breakers.clear()
+        BaseAgent._retry_handlers.clear()
     
-    @abstractmethod
     async def execute(self, action: str, parameters: Dict[str, Any]) -> AgentResponse:
         """Execute an action with the given parameters.
         
+        Subclasses must override this method.
+        
         Args:
             action: Action to execute
             parameters: Parameters for the action
             
         Returns:
             AgentResponse: Response from the agent
+            
+        Raises:
+            NotImplementedError: If the subclass does not implement it
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement execute()")
     
     async def execute_with_resilience(
         self, 
@@ -101,6 +299,11 @@ class BaseAgent(ABC):
             AgentResponse: Response from the agent
         """
         try:
+            if _HAS_ASYNCIO_TIMEOUT:
+                # Runs execute() in the current task instead of wrapping it
+                # in a new one like wait_for() does
+                async with asyncio.timeout(self.config.timeout):
+                    return await self.execute(action, parameters)
             return await asyncio.wait_for(
                 self.execute(action, parameters),
                 timeout=self.config.timeout
@@ -108,6 +311,82 @@ class BaseAgent(ABC):
         except asyncio.TimeoutError:
             raise Exception(f"Agent execution timeout after {self.config.timeout}s")
     
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use.
+        
+        A new session is created if the previous one was closed or belongs
+        to a different event loop.
+        
+        Returns:
+            aiohttp.ClientSession: Shared client session
+        """
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        session = BaseAgent._session
+        if session is None or session.closed or BaseAgent._session_loop is not loop:
+            stale, stale_loop = session, BaseAgent._session_loop
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30
+                )
+            )
+            BaseAgent._session = session
+            BaseAgent._session_loop = loop
+            # Closed only after the new session is stored, so concurrent
+            # callers cannot pick up the stale one meanwhile
+            if stale is not None and not stale.closed:
+                await _close_client(stale.close, stale_loop)
+        return session
+    
+    @classmethod
+    async def _get_http2_client(cls) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use.
+        
+        Concurrent requests to the same host are multiplexed over one
+        connection. Callers must check ``HTTP2_AVAILABLE`` first.
+        
+        Returns:
+            httpx.AsyncClient: Shared HTTP/2 client
+        """
+        import httpx
+        
+        loop = asyncio.get_running_loop()
+        client = BaseAgent._http2_client
+        if client is None or client.is_closed or BaseAgent._http2_client_loop is not loop:
+            stale, stale_loop = client, BaseAgent._http2_client_loop
+            client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=32
+                )
+            )
+            BaseAgent._http2_client = client
+            BaseAgent._http2_client_loop = loop
+            if stale is not None and not stale.is_closed:
+                await _close_client(stale.aclose, stale_loop)
+        return client
+    
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the shared HTTP session and HTTP/2 client if they are open."""
+        session, session_loop = BaseAgent._session, BaseAgent._session_loop
+        BaseAgent._session = None
+        BaseAgent._session_loop = None
+        if session is not None and not session.closed:
+            await _close_client(session.close, session_loop)
+        
+        client, client_loop = BaseAgent._http2_client, BaseAgent._http2_client_loop
+        BaseAgent._http2_client = None
+        BaseAgent._http2_client_loop = None
+        if client is not None and not client.is_closed:
+            await _close_client(client.aclose, client_loop)
+    
     @property
     def name(self) -> str:
         """Get agent name."""
@@ -122,7 +401,13 @@ class BaseAgent(ABC):
 class AgentFactory:
     """Factory for creating agents based on configuration."""
     
-    _agent_types: Dict[AgentType, Type[BaseAgent]] = {}
+    # Built-in implementations are given as "module:ClassName" relative to
+    # this package and imported the first time an agent of that type is made
+    _agent_types: Dict[AgentType, Union[str, Type[BaseAgent]]] = {
+        AgentType.AI_AGENT: ".ai_agent:AIAgent",
+        AgentType.MCP_SERVER: ".mcp_server:MCPServerAgent",
+        AgentType.HTTP_API: ".http_api:HTTPAPIAgent",
+    }
     
     @classmethod
     def register_agent_type(cls, agent_type: AgentType, agent_class: Type[BaseAgent]) -> None:
@@ -151,6 +436,9 @@ class AgentFactory:
             raise ValueError(f"Unknown agent type: {config.type}")
         
         agent_class = cls._agent_types[config.type]
+        if isinstance(agent_class, str):
+            agent_class = cls._import_agent_class(agent_class)
+            cls._agent_types[config.type] = agent_class
         return agent_class(config)
     
     @classmethod
@@ -161,3 +449,17 @@ class AgentFactory:
             List of registered agent types
         """
         return list(cls._agent_types.keys())
+    
+    @staticmethod
+    def _import_agent_class(path: str) -> Type[BaseAgent]:
+        """Import an agent class from a "module:ClassName" path.
+        
+        Args:
+            path: Module path relative to this package and class name
+            
+        Returns:
+            Agent implementation class
+        """
+        module_name, class_name = path.split(":")
+        module = importlib.import_module(module_name, package=__package__)
+        return getattr(module, class_name)
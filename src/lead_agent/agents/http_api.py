@@ -1,18 +1,60 @@
 """HTTP API Agent implementation."""
 
-import json
-from typing import Any, Dict
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import TYPE_CHECKING, Any, Dict
 from urllib.parse import urljoin
 
-import aiohttp
+import orjson
+
+from ..models import AgentConfig, AgentResponse
+from .base import BaseAgent
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+# Endpoints that urljoin would not resolve by plain concatenation: absolute
+# paths, dot segments, empty segments, queries, fragments, schemes,
+# parameters, IPv6 brackets, or characters that URL parsing strips
+_NEEDS_URLJOIN = re.compile(r"^[\x00-\x20/.]|[\x00-\x20]$|//|/\.|[?#:;[\]\t\r\n]")
 
-from ..models import AgentConfig, AgentResponse, AgentType
-from .base import BaseAgent, AgentFactory
+
+def _is_json_content_type(content_type: str) -> bool:
+    """Check if a content type is JSON (application/json or a +json suffix)."""
+    return content_type == "application/json" or (
+        content_type.startswith("application/") and content_type.endswith("+json")
+    )
 
 
 class HTTPAPIAgent(BaseAgent):
     """Agent for communicating with HTTP APIs."""
     
+    @staticmethod
+    async def _read_body(response: aiohttp.ClientResponse) -> Any:
+        """Read a response body, decoding JSON directly from the raw bytes.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            Parsed JSON for JSON responses, otherwise the body as text
+        """
+        body = await response.read()
+        
+        # Try to parse JSON response, fallback to text
+        if _is_json_content_type(response.content_type):
+            if not body.strip():
+                return None
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                pass
+        
+        return body.decode(response.get_encoding(), errors="replace")
+    
     async def execute(self, action: str, parameters: Dict[str, Any]) -> AgentResponse:
         """Execute an action with the HTTP API.
         
@@ -23,81 +65,69 @@ class HTTPAPIAgent(BaseAgent):
         Returns:
             AgentResponse: Response from the HTTP API
         """
+        import aiohttp
+        
+        # Extract HTTP method and endpoint from action or parameters
+        method = parameters.get("method", "POST").upper()
+        endpoint = parameters.get("endpoint", action)
+        
+        # Build full URL; plain relative paths are appended to the endpoint
+        # base directly, which gives the same URL as urljoin
+        if endpoint.startswith(("http://", "https://")):
+            url = endpoint
+        elif (self._endpoint_base is not None and endpoint
+                and not _NEEDS_URLJOIN.search(endpoint)):
+            url = self._endpoint_base + endpoint
+        else:
+            url = urljoin(self.config.endpoint or "", endpoint)
+        
+        # Prepare request data
+        request_data = parameters.get("data", {})
+        query_params = parameters.get("params", {})
+        
+        # Merge custom headers under the precomputed ones, so per-call
+        # headers never override the configured authentication
+        custom_headers = parameters.get("headers")
+        if custom_headers:
+            headers = custom_headers | self._base_headers
+        else:
+            headers = self._base_headers
+        
+        session = await self._get_session()
+        
+        # Only the network round-trip can raise the errors handled below;
+        # anything else propagates to the retry and circuit breaker logic
         try:
-            # Extract HTTP method and endpoint from action or parameters
-            method = parameters.get("method", "POST").upper()
-            endpoint = parameters.get("endpoint", action)
-            
-            # Build full URL
-            if endpoint.startswith("http"):
-                url = endpoint
-            else:
-                url = urljoin(self.config.endpoint or "", endpoint)
-            
-            # Prepare request data
-            request_data = parameters.get("data", {})
-            query_params = parameters.get("params", {})
-            
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            # Add custom headers
-            custom_headers = parameters.get("headers", {})
-            headers.update(custom_headers)
-            
-            # Add authentication if configured
-            if self.config.authentication:
-                auth_type = self.config.authentication.get("type")
-                if auth_type == "bearer":
-                    token = self.config.authentication.get("token")
-                    headers["Authorization"] = f"Bearer {token}"
-                elif auth_type == "api_key":
-                    key = self.config.authentication.get("key")
-                    key_header = self.config.authentication.get("header", "X-API-Key")
-                    headers[key_header] = key
-                elif auth_type == "basic":
-                    username = self.config.authentication.get("username")
-                    password = self.config.authentication.get("password")
-                    auth = aiohttp.BasicAuth(username, password)
+            async with session.request(
+                method=method,
+                url=url,
+                json=request_data if method in ["POST", "PUT", "PATCH"] else None,
+                params=query_params,
+                headers=headers,
+                auth=self._basic_auth,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+            ) as response:
+                
+                if method == "HEAD" or response.status == 204:
+                    result = None
                 else:
-                    auth = None
-            else:
-                auth = None
-            
-            # Make HTTP request
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method=method,
-                    url=url,
-                    json=request_data if method in ["POST", "PUT", "PATCH"] else None,
-                    params=query_params,
-                    headers=headers,
-                    auth=auth,
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-                ) as response:
-                    
-                    # Try to parse JSON response, fallback to text
-                    try:
-                        result = await response.json()
-                    except (json.JSONDecodeError, aiohttp.ContentTypeError):
-                        result = await response.text()
+                    result = await self._read_body(response)
+                
+                success = 200 <= response.status < 300
+                
+                return AgentResponse(
+                    success=success,
+                    result=result if success else None,
+                    error=None if success else f"HTTP {response.status}: {result}",
+                    metadata={
+                        "status_code": response.status,
+                        "method": method,
+                        "url": str(response.url),
+                        "headers": dict(response.headers)
+                    }
+                )
                     
-                    success = 200 <= response.status < 300
-                    
-                    return AgentResponse(
-                        success=success,
-                        result=result if success else None,
-                        error=None if success else f"HTTP {response.status}: {result}",
-                        metadata={
-                            "status_code": response.status,
-                            "method": method,
-                            "url": str(response.url),
-                            "headers": dict(response.headers)
-                        }
-                    )
-                        
-        except aiohttp.ClientTimeout:
+        except asyncio.TimeoutError:
             return AgentResponse(
                 success=False,
                 error="Request timeout"
@@ -107,12 +137,3 @@ class HTTPAPIAgent(BaseAgent):
                 success=False,
                 error=f"HTTP client error: {str(e)}"
             )
-        except Exception as e:
-            return AgentResponse(
-                success=False,
-                error=f"Unexpected error: {str(e)}"
-            )
-
-
-# Register the agent type
-AgentFactory.register_agent_type(AgentType.HTTP_API, HTTPAPIAgent)
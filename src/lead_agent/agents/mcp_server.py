@@ -1,16 +1,177 @@
 """MCP Server Agent implementation."""
 
+import asyncio
 import json
-from typing import Any, Dict
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, List, Sequence, Tuple
 
-import aiohttp
+import orjson
 
-from ..models import AgentConfig, AgentResponse, AgentType
-from .base import BaseAgent, AgentFactory
+from ..models import AgentConfig, AgentResponse
+from .base import HTTP2_AVAILABLE, BaseAgent, _lru_get
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Responses larger than this are parsed with simdjson when it is installed
+_SIMDJSON_THRESHOLD = 64 * 1024
+_simdjson_parser = simdjson.Parser() if simdjson is not None else None
+
+# Responses larger than this are parsed incrementally while they are read
+# from the connection when ijson is installed
+_STREAMING_THRESHOLD = 1024 * 1024
+
+
+def _loads(data: Any) -> Any:
+    """Parse a JSON response body.
+    
+    Large bodies go through simdjson when it is available. Its lazy proxies
+    are materialized before returning, since the shared parser reuses its
+    buffers on the next call.
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        Decoded JSON value
+    """
+    if _simdjson_parser is not None and len(data) > _SIMDJSON_THRESHOLD:
+        try:
+            doc = _simdjson_parser.parse(data)
+        except ValueError:
+            # Let orjson raise a JSONDecodeError for invalid documents
+            return orjson.loads(data)
+        if isinstance(doc, simdjson.Object):
+            return doc.as_dict()
+        if isinstance(doc, simdjson.Array):
+            return doc.as_list()
+        return doc
+    return orjson.loads(data)
+
+
+async def _stream_loads(stream: Any) -> Dict[str, Any]:
+    """Parse a JSON-RPC response object while it is being received.
+    
+    Each top-level member is decoded as soon as its bytes arrive, so
+    parsing overlaps the transfer instead of starting after the last chunk.
+    
+    Args:
+        stream: Async byte stream with a ``read`` coroutine
+        
+    Returns:
+        Dict[str, Any]: Decoded response object
+        
+    Raises:
+        json.JSONDecodeError: If the body is not a valid JSON object
+    """
+    try:
+        return {
+            key: value
+            async for key, value in ijson.kvitems_async(stream, "", use_float=True)
+        }
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(str(e), "", 0) from e
 
 
 class MCPServerAgent(BaseAgent):
-    """Agent for communicating with MCP (Model Context Protocol) servers."""
+    """Agent for communicating with MCP (Model Context Protocol) servers.
+    
+    Setting ``http2: true`` in the agent's ``custom_params`` sends calls over
+    a shared HTTP/2 client when httpx and h2 are installed, so concurrent
+    tool calls to one server share a single connection. At most
+    ``max_concurrency`` (default 32) of those calls are in flight at once
+    per endpoint, across all agents talking to it.
+    """
+    
+    # Static JSON-RPC envelope, serialized once; only the tool name and
+    # arguments are encoded per call
+    _PAYLOAD_PREFIX = b'{"jsonrpc":"2.0","id":1,"method":"tools/call","params":{"name":'
+    
+    # HTTP/2 concurrency limits shared by agents that talk to the same
+    # endpoint, as (event loop, semaphore) pairs keyed by (endpoint, limit)
+    _semaphores: "OrderedDict[tuple, tuple]" = OrderedDict()
+    
+    def __init__(self, config: AgentConfig):
+        """Initialize the agent.
+        
+        Args:
+            config: Agent configuration
+        """
+        super().__init__(config)
+        # The body is sent pre-encoded, so the content type is set explicitly
+        self._rpc_headers = MappingProxyType(
+            {"Content-Type": "application/json", **self._base_headers}
+        )
+        self._max_concurrency = config.custom_params.get("max_concurrency", 32)
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent HTTP/2 calls to the endpoint.
+        
+        Agents with the same endpoint and limit share one semaphore, like
+        they share a circuit breaker. Semaphores belong to an event loop,
+        so a new one is created when the endpoint is used from a different
+        loop.
+        
+        Returns:
+            asyncio.Semaphore: Concurrency limit for the endpoint
+        """
+        loop = asyncio.get_running_loop()
+        key = (self.config.endpoint, self._max_concurrency)
+        semaphores = MCPServerAgent._semaphores
+        semaphore_loop, semaphore = _lru_get(
+            semaphores, key, BaseAgent._shared_state_size,
+            lambda: (loop, asyncio.Semaphore(self._max_concurrency))
+        )
+        if semaphore_loop is not loop:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            semaphores[key] = (loop, semaphore)
+        return semaphore
+    
+    async def execute_many(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any]]]
+    ) -> List[AgentResponse]:
+        """Execute several tool calls concurrently.
+        
+        The calls are issued together so that, over HTTP/2, they are
+        multiplexed on one connection instead of running one after another.
+        
+        Args:
+            calls: (action, parameters) pairs
+            
+        Returns:
+            List[AgentResponse]: Responses in the order of the calls
+        """
+        return list(await asyncio.gather(*(
+            self.execute_with_resilience(action, parameters)
+            for action, parameters in calls
+        )))
+    
+    def _build_payload(self, action: str, parameters: Dict[str, Any]) -> bytes:
+        """Encode a JSON-RPC tools/call request.
+        
+        Args:
+            action: Tool name
+            parameters: Tool arguments
+            
+        Returns:
+            bytes: Serialized request body
+        """
+        return (
+            self._PAYLOAD_PREFIX
+            + orjson.dumps(action)
+            + b',"arguments":'
+            + orjson.dumps(parameters)
+            + b"}}"
+        )
     
     async def execute(self, action: str, parameters: Dict[str, Any]) -> AgentResponse:
         """Execute an action with the MCP server.
@@ -22,81 +183,43 @@ class MCPServerAgent(BaseAgent):
         Returns:
             AgentResponse: Response from the MCP server
         """
+        import aiohttp
+        
+        # MCP protocol typically uses JSON-RPC format
+        payload = self._build_payload(action, parameters)
+        
+        if self.config.custom_params.get("http2") and HTTP2_AVAILABLE:
+            async with self._get_semaphore():
+                return await self._execute_http2(payload)
+        
+        session = await self._get_session()
+        
+        # Only the network round-trip can raise the errors handled below;
+        # anything else propagates to the retry and circuit breaker logic
         try:
-            # MCP protocol typically uses JSON-RPC format
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": action,
-                    "arguments": parameters
-                }
-            }
-            
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            # Add authentication if configured
-            if self.config.authentication:
-                auth_type = self.config.authentication.get("type")
-                if auth_type == "bearer":
-                    token = self.config.authentication.get("token")
-                    headers["Authorization"] = f"Bearer {token}"
-                elif auth_type == "api_key":
-                    key = self.config.authentication.get("key")
-                    key_header = self.config.authentication.get("header", "X-API-Key")
-                    headers[key_header] = key
-            
-            # Make HTTP request to MCP server
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.config.endpoint,
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-                ) as response:
-                    
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        # Handle JSON-RPC response format
-                        if "result" in result:
-                            return AgentResponse(
-                                success=True,
-                                result=result["result"],
-                                metadata={
-                                    "status_code": response.status,
-                                    "jsonrpc_id": result.get("id")
-                                }
-                            )
-                        elif "error" in result:
-                            error_info = result["error"]
-                            return AgentResponse(
-                                success=False,
-                                error=f"MCP Error {error_info.get('code')}: {error_info.get('message')}",
-                                metadata={
-                                    "status_code": response.status,
-                                    "jsonrpc_id": result.get("id"),
-                                    "error_code": error_info.get("code")
-                                }
-                            )
-                        else:
-                            return AgentResponse(
-                                success=False,
-                                error="Invalid MCP response format",
-                                metadata={"status_code": response.status}
-                            )
+            async with session.post(
+                self.config.endpoint,
+                data=payload,
+                headers=self._rpc_headers,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+            ) as response:
+                
+                if response.status == 200:
+                    content_length = response.content_length
+                    if ijson is not None and content_length and content_length > _STREAMING_THRESHOLD:
+                        result = await _stream_loads(response.content)
                     else:
-                        error_text = await response.text()
-                        return AgentResponse(
-                            success=False,
-                            error=f"HTTP {response.status}: {error_text}",
-                            metadata={"status_code": response.status}
-                        )
-                        
-        except aiohttp.ClientTimeout:
+                        result = await response.json(loads=_loads)
+                    return self._parse_rpc_response(response.status, result)
+                else:
+                    error_text = await response.text()
+                    return AgentResponse(
+                        success=False,
+                        error=f"HTTP {response.status}: {error_text}",
+                        metadata={"status_code": response.status}
+                    )
+                    
+        except asyncio.TimeoutError:
             return AgentResponse(
                 success=False,
                 error="Request timeout"
@@ -111,12 +234,89 @@ class MCPServerAgent(BaseAgent):
                 success=False,
                 error=f"Invalid JSON response: {str(e)}"
             )
-        except Exception as e:
+    
+    async def _execute_http2(self, payload: bytes) -> AgentResponse:
+        """Send a JSON-RPC request over the shared HTTP/2 client.
+        
+        Args:
+            payload: Serialized JSON-RPC request
+            
+        Returns:
+            AgentResponse: Response from the MCP server
+        """
+        import httpx
+        
+        client = await self._get_http2_client()
+        
+        try:
+            response = await client.post(
+                self.config.endpoint,
+                content=payload,
+                headers=self._rpc_headers,
+                timeout=self.config.timeout
+            )
+            
+            if response.status_code == 200:
+                return self._parse_rpc_response(response.status_code, _loads(response.content))
+            else:
+                return AgentResponse(
+                    success=False,
+                    error=f"HTTP {response.status_code}: {response.text}",
+                    metadata={"status_code": response.status_code}
+                )
+                
+        except httpx.TimeoutException:
             return AgentResponse(
                 success=False,
-                error=f"Unexpected error: {str(e)}"
+                error="Request timeout"
+            )
+        except httpx.HTTPError as e:
+            return AgentResponse(
+                success=False,
+                error=f"HTTP client error: {str(e)}"
+            )
+        except json.JSONDecodeError as e:
+            return AgentResponse(
+                success=False,
+                error=f"Invalid JSON response: {str(e)}"
+            )
+    
+    @staticmethod
+    def _parse_rpc_response(status: int, result: Dict[str, Any]) -> AgentResponse:
+        """Convert a JSON-RPC response body into an agent response.
+        
+        Args:
+            status: HTTP status code
+            result: Decoded JSON-RPC response
+            
+        Returns:
+            AgentResponse: Response from the MCP server
+        """
+        # Handle JSON-RPC response format. The validating constructor runs
+        # in pydantic-core and is faster than model_construct() here
+        if "result" in result:
+            return AgentResponse(
+                success=True,
+                result=result["result"],
+                metadata={
+                    "status_code": status,
+                    "jsonrpc_id": result.get("id")
+                }
+            )
+        elif "error" in result:
+            error_info = result["error"]
+            return AgentResponse(
+                success=False,
+                error=f"MCP Error {error_info.get('code')}: {error_info.get('message')}",
+                metadata={
+                    "status_code": status,
+                    "jsonrpc_id": result.get("id"),
+                    "error_code": error_info.get("code")
+                }
+            )
+        else:
+            return AgentResponse(
+                success=False,
+                error="Invalid MCP response format",
+                metadata={"status_code": status}
             )
-
-
-# Register the agent type
-AgentFactory.register_agent_type(AgentType.MCP_SERVER, MCPServerAgent)
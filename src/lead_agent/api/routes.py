@@ -1,17 +1,25 @@
 """API routes for the Lead Agent REST API."""
 
 import asyncio
+import heapq
+import json
 import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID, uuid4
 
 import structlog
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from pydantic import ValidationError
 
+from ..agents.base import AgentFactory
 from ..lead_agent import LeadAgent
-from ..models import WorkflowResult
+from ..models import AgentConfig, WorkflowConfig, WorkflowResult
 from .models import (
     AgentTestRequest,
     AgentTestResponse,
@@ -25,9 +33,76 @@ from .models import (
 
 logger = structlog.get_logger(__name__)
 
-# Global storage for workflow executions (in production, use a database)
-workflow_executions: Dict[UUID, WorkflowResponse] = {}
-execution_results: Dict[UUID, WorkflowResult] = {}
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass
+class _ExecutionRecord:
+    """In-memory state of a workflow execution.
+    
+    Timestamps are kept as integer nanoseconds since the epoch (UTC) and
+    only turned into datetimes when a response is built.
+    """
+    
+    execution_id: UUID
+    name: str
+    status: str
+    created_ns: int
+    total_tasks: int = 0
+    started_ns: Optional[int] = None
+    completed_ns: Optional[int] = None
+    execution_time: Optional[float] = None
+    completed_tasks: int = 0
+    results: Optional[Dict[str, Any]] = None
+    errors: Optional[Dict[str, str]] = None
+
+
+def _ns_to_datetime(ns: Optional[int]) -> Optional[datetime]:
+    """Convert nanoseconds since the epoch to a naive UTC datetime."""
+    if ns is None:
+        return None
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def _to_response(record: _ExecutionRecord) -> WorkflowResponse:
+    """Build the API response for an execution record."""
+    return WorkflowResponse.model_construct(
+        execution_id=record.execution_id,
+        name=record.name,
+        status=record.status,
+        created_at=_ns_to_datetime(record.created_ns),
+        started_at=_ns_to_datetime(record.started_ns),
+        completed_at=_ns_to_datetime(record.completed_ns),
+        execution_time=record.execution_time,
+        total_tasks=record.total_tasks,
+        completed_tasks=record.completed_tasks,
+        results=record.results,
+        errors=record.errors
+    )
+
+
+# Global storage for workflow executions (in production, use a database).
+# Executions are sharded on the low bits of their ID so each dict stays
+# small; every shard is kept in creation order so its oldest entries are
+# evicted first
+_SHARDS = 16
+_execution_shards: List["OrderedDict[UUID, _ExecutionRecord]"] = [
+    OrderedDict() for _ in range(_SHARDS)
+]
+_result_shards: List[Dict[UUID, WorkflowResult]] = [{} for _ in range(_SHARDS)]
+
+# Bounds on the execution store. Finished executions are evicted once they
+# are older than the TTL or their shard holds more than its share of the
+# maximum
+MAX_STORED_EXECUTIONS = 10_000
+EXECUTION_TTL = timedelta(days=1)
+_EXECUTION_TTL_NS = int(EXECUTION_TTL.total_seconds()) * 1_000_000_000
+
+# Statuses of executions that are done and may be evicted
+_FINISHED_STATUSES = {"completed", "failed", "partially_completed", "cancelled"}
+
+# Execution IDs bucketed by status, so filtered listings skip a full scan
+status_index: Dict[str, Set[UUID]] = defaultdict(set)
 
 # Create API router
 router = APIRouter()
@@ -35,6 +110,67 @@ router = APIRouter()
 # Service start time for uptime calculation
 start_time = time.time()
 
+# Workflow requests larger than this are validated in a worker thread so
+# the event loop keeps serving other requests
+_THREADPOOL_VALIDATION_THRESHOLD = 64 * 1024
+
+
+def _bucket(execution_id: UUID) -> "OrderedDict[UUID, _ExecutionRecord]":
+    """Get the execution shard holding an execution ID."""
+    return _execution_shards[execution_id.int & (_SHARDS - 1)]
+
+
+def _result_bucket(execution_id: UUID) -> Dict[UUID, WorkflowResult]:
+    """Get the result shard holding an execution ID."""
+    return _result_shards[execution_id.int & (_SHARDS - 1)]
+
+
+def _get_execution(execution_id: UUID) -> _ExecutionRecord:
+    """Look up an execution, raising a 404 if it is unknown."""
+    workflow = _bucket(execution_id).get(execution_id)
+    if workflow is None:
+        raise HTTPException(status_code=404, detail="Workflow execution not found")
+    return workflow
+
+
+def _set_status(execution_id: UUID, status: str) -> _ExecutionRecord:
+    """Update a workflow's status and move it to the matching index bucket."""
+    workflow = _bucket(execution_id)[execution_id]
+    status_index[workflow.status].discard(execution_id)
+    workflow.status = status
+    status_index[status].add(execution_id)
+    return workflow
+
+
+def _evict_executions(execution_id: UUID) -> None:
+    """Evict the oldest finished executions that are expired or over capacity.
+    
+    Only the shard holding ``execution_id`` is trimmed. Executions still in
+    progress are skipped rather than evicted, so the background runner
+    never loses the entry it is updating and a long-running execution does
+    not hold back eviction of the finished ones behind it.
+    
+    Args:
+        execution_id: ID of the execution that was just stored
+    """
+    shard = _bucket(execution_id)
+    results = _result_bucket(execution_id)
+    excess = len(shard) - MAX_STORED_EXECUTIONS // _SHARDS
+    cutoff = time.time_ns() - _EXECUTION_TTL_NS
+    evicted = []
+    for execution_id, workflow in shard.items():
+        # Shards are in creation order, so no later entry is expired either
+        if excess <= 0 and workflow.created_ns > cutoff:
+            break
+        if workflow.status in _FINISHED_STATUSES:
+            evicted.append((execution_id, workflow))
+            excess -= 1
+    
+    for execution_id, workflow in evicted:
+        del shard[execution_id]
+        results.pop(execution_id, None)
+        status_index[workflow.status].discard(execution_id)
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -47,32 +183,95 @@ async def health_check():
     )
 
 
-@router.post("/workflows", response_model=WorkflowResponse)
+async def _parse_workflow_request(request: Request) -> WorkflowRequest:
+    """Validate the raw request body as a WorkflowRequest.
+    
+    Args:
+        request: Incoming HTTP request
+        
+    Returns:
+        WorkflowRequest: Validated workflow request
+        
+    Raises:
+        RequestValidationError: If the body is not a valid workflow request
+        HTTPException: If the body cannot be decoded as text
+    """
+    body = await request.body()
+    if not body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    
+    try:
+        if len(body) > _THREADPOOL_VALIDATION_THRESHOLD:
+            return await run_in_threadpool(WorkflowRequest.model_validate_json, body)
+        return WorkflowRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = e.errors(include_url=False)
+        if errors[0]["type"] == "json_invalid":
+            # Decode with json to report the position FastAPI reports
+            try:
+                json.loads(body)
+            except json.JSONDecodeError as decode_error:
+                raise RequestValidationError([{
+                    "type": "json_invalid",
+                    "loc": ("body", decode_error.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": decode_error.msg}
+                }])
+            except UnicodeDecodeError as decode_error:
+                raise HTTPException(
+                    status_code=400, detail="There was an error parsing the body"
+                ) from decode_error
+        
+        # Match the error locations FastAPI reports for declared bodies
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in errors]
+        )
+
+
+@router.post(
+    "/workflows",
+    response_model=WorkflowResponse,
+    # The body is parsed by hand, so its schema is declared explicitly
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": WorkflowRequest.model_json_schema()}
+            }
+        }
+    }
+)
 async def create_workflow(
-    workflow: WorkflowRequest,
+    request: Request,
     background_tasks: BackgroundTasks
 ):
     """Create and execute a new workflow."""
+    workflow = await _parse_workflow_request(request)
     execution_id = uuid4()
     
-    # Create workflow response
-    workflow_response = WorkflowResponse(
+    # Create the execution record
+    record = _ExecutionRecord(
         execution_id=execution_id,
         name=workflow.name,
         status="queued",
-        created_at=datetime.utcnow(),
+        created_ns=time.time_ns(),
         total_tasks=len(workflow.tasks)
     )
     
     # Store workflow execution
-    workflow_executions[execution_id] = workflow_response
+    _bucket(execution_id)[execution_id] = record
+    status_index[record.status].add(execution_id)
+    _evict_executions(execution_id)
     
     # Execute workflow in background
     background_tasks.add_task(execute_workflow_background, execution_id, workflow)
     
     logger.info("Workflow queued for execution", execution_id=str(execution_id), name=workflow.name)
     
-    return workflow_response
+    return _to_response(record)
 
 
 @router.get("/workflows", response_model=WorkflowListResponse)
@@ -82,19 +281,18 @@ async def list_workflows(
     status: Optional[str] = Query(None, description="Filter by status")
 ):
     """List all workflow executions."""
-    workflows = list(workflow_executions.values())
-    
     # Filter by status if provided
     if status:
-        workflows = [w for w in workflows if w.status == status]
-    
-    # Sort by creation time (newest first)
-    workflows.sort(key=lambda w: w.created_at, reverse=True)
+        workflows = [_bucket(eid)[eid] for eid in status_index.get(status, ())]
+    else:
+        workflows = [w for shard in _execution_shards for w in shard.values()]
     
-    # Paginate
+    # Paginate, selecting only the newest end_idx workflows instead of
+    # sorting all of them
     start_idx = (page - 1) * page_size
     end_idx = start_idx + page_size
-    paginated_workflows = workflows[start_idx:end_idx]
+    newest = heapq.nlargest(end_idx, workflows, key=lambda w: w.created_ns)
+    paginated_workflows = [_to_response(w) for w in newest[start_idx:]]
     
     return WorkflowListResponse(
         workflows=paginated_workflows,
@@ -107,19 +305,13 @@ async def list_workflows(
 @router.get("/workflows/{execution_id}", response_model=WorkflowResponse)
 async def get_workflow(execution_id: UUID):
     """Get workflow execution details."""
-    if execution_id not in workflow_executions:
-        raise HTTPException(status_code=404, detail="Workflow execution not found")
-    
-    return workflow_executions[execution_id]
+    return _to_response(_get_execution(execution_id))
 
 
 @router.get("/workflows/{execution_id}/status", response_model=WorkflowStatusResponse)
 async def get_workflow_status(execution_id: UUID):
     """Get workflow execution status."""
-    if execution_id not in workflow_executions:
-        raise HTTPException(status_code=404, detail="Workflow execution not found")
-    
-    workflow = workflow_executions[execution_id]
+    workflow = _get_execution(execution_id)
     
     # Calculate progress
     progress = 0.0
@@ -128,7 +320,7 @@ async def get_workflow_status(execution_id: UUID):
     
     # Determine current task
     current_task = None
-    if workflow.status == "running" and execution_id in execution_results:
+    if workflow.status == "running" and execution_id in _result_bucket(execution_id):
         # This would require more sophisticated tracking in a real implementation
         current_task = "In progress..."
     
@@ -144,20 +336,17 @@ async def get_workflow_status(execution_id: UUID):
 @router.delete("/workflows/{execution_id}")
 async def cancel_workflow(execution_id: UUID):
     """Cancel a workflow execution (if still running)."""
-    if execution_id not in workflow_executions:
-        raise HTTPException(status_code=404, detail="Workflow execution not found")
+    workflow = _get_execution(execution_id)
     
-    workflow = workflow_executions[execution_id]
-    
-    if workflow.status in ["completed", "failed", "cancelled"]:
+    if workflow.status in _FINISHED_STATUSES:
         raise HTTPException(
             status_code=400, 
             detail=f"Cannot cancel workflow with status: {workflow.status}"
         )
     
     # Update status to cancelled
-    workflow.status = "cancelled"
-    workflow.completed_at = datetime.utcnow()
+    _set_status(execution_id, "cancelled")
+    workflow.completed_ns = time.time_ns()
     
     logger.info("Workflow cancelled", execution_id=str(execution_id))
     
@@ -170,12 +359,8 @@ async def test_agent(agent_test: AgentTestRequest):
     start_time = time.time()
     
     try:
-        # Create a temporary agent for testing
-        from ..agents.base import AgentFactory
-        from ..models import AgentConfig
-        
-        # Convert dict to AgentConfig
-        agent_config = AgentConfig(**agent_test.agent_config)
+        # Validate the submitted dict and create a temporary agent for testing
+        agent_config = AgentConfig.model_validate(agent_test.agent_config)
         agent = AgentFactory.create_agent(agent_config)
         
         # Execute test action
@@ -206,42 +391,52 @@ async def test_agent(agent_test: AgentTestRequest):
         )
 
 
+def _finish_execution(execution_id: UUID, status: str) -> Optional[_ExecutionRecord]:
+    """Record the final status of an execution unless it was cancelled.
+    
+    Args:
+        execution_id: ID of the execution that finished
+        status: Final status reported by the runner
+        
+    Returns:
+        The updated record, or None if the execution was cancelled or
+        evicted while it ran
+    """
+    record = _bucket(execution_id).get(execution_id)
+    if record is None or record.status == "cancelled":
+        return None
+    _set_status(execution_id, status)
+    record.completed_ns = time.time_ns()
+    return record
+
+
 async def execute_workflow_background(execution_id: UUID, workflow_request: WorkflowRequest):
     """Execute workflow in the background."""
+    record = _bucket(execution_id).get(execution_id)
+    if record is None or record.status == "cancelled":
+        # Cancelled before it was picked up
+        return
+    
     try:
         # Update status to running
-        workflow_executions[execution_id].status = "running"
-        workflow_executions[execution_id].started_at = datetime.utcnow()
+        _set_status(execution_id, "running").started_ns = time.time_ns()
         
         logger.info("Starting workflow execution", execution_id=str(execution_id))
         
-        # Convert workflow request to dict
-        workflow_dict = {
-            "name": workflow_request.name,
-            "description": workflow_request.description,
-            "version": workflow_request.version,
-            "parallel_execution": workflow_request.parallel_execution,
-            "failure_strategy": workflow_request.failure_strategy,
-            "global_timeout": workflow_request.global_timeout,
-            "agents": workflow_request.agents,
-            "tasks": workflow_request.tasks
-        }
-        
-        # Execute workflow
+        # Execute workflow; the request fields map one-to-one onto the
+        # workflow configuration, so it is validated straight from them
+        config = WorkflowConfig.model_validate(workflow_request, from_attributes=True)
         lead_agent = LeadAgent()
-        result = await lead_agent.execute_workflow_from_dict(workflow_dict)
-        
-        # Store result
-        execution_results[execution_id] = result
+        result = await lead_agent.execute_workflow(config)
         
         # Update workflow response
-        workflow_response = workflow_executions[execution_id]
-        workflow_response.status = result.status
-        workflow_response.completed_at = datetime.utcnow()
-        workflow_response.execution_time = result.execution_time
-        workflow_response.completed_tasks = result.completed_tasks
-        workflow_response.results = result.results
-        workflow_response.errors = result.errors
+        record = _finish_execution(execution_id, result.status)
+        if record is not None:
+            _result_bucket(execution_id)[execution_id] = result
+            record.execution_time = result.execution_time
+            record.completed_tasks = result.completed_tasks
+            record.results = result.results
+            record.errors = result.errors
         
         logger.info(
             "Workflow execution completed", 
@@ -258,7 +453,6 @@ async def execute_workflow_background(execution_id: UUID, workflow_request: Work
         )
         
         # Update status to failed
-        workflow_response = workflow_executions[execution_id]
-        workflow_response.status = "failed"
-        workflow_response.completed_at = datetime.utcnow()
-        workflow_response.errors = {"execution_error": str(e)}
+        record = _finish_execution(execution_id, "failed")
+        if record is not None:
+            record.errors = {"execution_error": str(e)}
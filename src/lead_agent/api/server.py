@@ -4,12 +4,14 @@ import argparse
 import sys
 from contextlib import asynccontextmanager
 
+import orjson
 import structlog
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from ..agents.base import BaseAgent
 from .routes import router
 
 
@@ -23,7 +25,10 @@ structlog.configure(
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
-        structlog.processors.JSONRenderer()
+        # orjson returns bytes, the stdlib logging backend expects str
+        structlog.processors.JSONRenderer(
+            serializer=lambda obj, **kwargs: orjson.dumps(obj, **kwargs).decode()
+        )
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -42,6 +47,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down Lead Agent API server")
+    await BaseAgent.close_session()
 
 
 # Create FastAPI application
@@ -51,6 +57,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -83,7 +90,7 @@ async def root():
 async def global_exception_handler(request, exc):
     """Global exception handler."""
     logger.error("Unhandled exception", error=str(exc), path=request.url.path)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -127,6 +134,12 @@ def main():
         default=1, 
         help="Number of worker processes"
     )
+    parser.add_argument(
+        "--loop", 
+        choices=["auto", "asyncio", "uvloop"], 
+        default="auto", 
+        help="Event loop implementation (auto uses uvloop when installed)"
+    )
     parser.add_argument(
         "--config", 
         help="Path to configuration file"
@@ -154,6 +167,7 @@ def main():
         reload=args.reload,
         log_level=log_level,
         workers=args.workers if not args.reload else 1,
+        loop=args.loop,
         access_log=True
     )
 
@@ -1,13 +1,23 @@
 """Configuration loader for workflows and agents."""
 
+import hashlib
 import json
+from array import array
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, List, Optional, Union
 
+import orjson
 import yaml
 from pydantic import ValidationError
 
-from .models import WorkflowConfig
+from .models import DependencyGraph, WorkflowConfig, build_dependency_graph
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 class ConfigurationError(Exception):
@@ -17,6 +27,13 @@ class ConfigurationError(Exception):
 
 class ConfigLoader:
     """Loads and validates workflow configurations."""
+    
+    # Validated configurations keyed by a digest of their canonical JSON form
+    _config_cache: "OrderedDict[bytes, WorkflowConfig]" = OrderedDict()
+    _config_cache_size = 256
+    
+    # Loaded configuration files keyed by (path, mtime_ns, size)
+    _file_cache: "OrderedDict[tuple, WorkflowConfig]" = OrderedDict()
 
     @staticmethod
     def load_from_file(file_path: Union[str, Path]) -> WorkflowConfig:
@@ -33,30 +50,49 @@ class ConfigLoader:
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
             raise ConfigurationError(f"Configuration file not found: {file_path}")
         
+        # Unchanged files are served without re-reading or re-validating
+        file_cache = ConfigLoader._file_cache
+        file_key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if file_key in file_cache:
+            file_cache.move_to_end(file_key)
+            return file_cache[file_key]
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if file_path.suffix.lower() in ['.yaml', '.yml']:
-                    config_data = yaml.safe_load(f)
-                elif file_path.suffix.lower() == '.json':
-                    config_data = json.load(f)
-                else:
-                    raise ConfigurationError(
-                        f"Unsupported file format: {file_path.suffix}"
-                    )
-        except (yaml.YAMLError, json.JSONDecodeError) as e:
+            # Both parsers decode UTF-8 themselves, so the file is read as bytes
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            
+            if file_path.suffix.lower() in ['.yaml', '.yml']:
+                config_data = yaml.load(content, Loader=_YamlLoader)
+            elif file_path.suffix.lower() == '.json':
+                config_data = orjson.loads(content)
+            else:
+                raise ConfigurationError(
+                    f"Unsupported file format: {file_path.suffix}"
+                )
+        except (yaml.YAMLError, orjson.JSONDecodeError) as e:
             raise ConfigurationError(f"Failed to parse configuration file: {e}")
         except Exception as e:
             raise ConfigurationError(f"Failed to read configuration file: {e}")
         
-        return ConfigLoader.load_from_dict(config_data)
+        config = ConfigLoader.load_from_dict(config_data)
+        file_cache[file_key] = config
+        if len(file_cache) > ConfigLoader._config_cache_size:
+            file_cache.popitem(last=False)
+        return config
     
     @staticmethod
     def load_from_dict(config_data: Dict[str, Any]) -> WorkflowConfig:
         """Load workflow configuration from a dictionary.
         
+        Identical configurations are validated once and the resulting
+        WorkflowConfig is shared between callers.
+        
         Args:
             config_data: Configuration data as dictionary
             
@@ -66,12 +102,49 @@ class ConfigLoader:
         Raises:
             ConfigurationError: If validation fails
         """
+        cache = ConfigLoader._config_cache
+        key = ConfigLoader._canonical_key(config_data)
+        if key is not None and key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        
         try:
-            return WorkflowConfig(**config_data)
+            config = WorkflowConfig.model_validate(config_data)
         except ValidationError as e:
             raise ConfigurationError(f"Configuration validation failed: {e}")
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration: {e}")
+        
+        if key is not None:
+            cache[key] = config
+            if len(cache) > ConfigLoader._config_cache_size:
+                cache.popitem(last=False)
+        return config
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the caches of validated configurations and loaded files."""
+        ConfigLoader._config_cache.clear()
+        ConfigLoader._file_cache.clear()
+    
+    @staticmethod
+    def _canonical_key(config_data: Any) -> Optional[bytes]:
+        """Compute the cache key for configuration data.
+        
+        Args:
+            config_data: Configuration data as dictionary
+            
+        Returns:
+            Digest of the canonical JSON encoding, or None if the data
+            cannot be encoded
+        """
+        try:
+            # No default=str: a value JSON cannot encode, such as a date,
+            # skips the cache instead of sharing a key with its string form
+            encoded = json.dumps(config_data, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).digest()
     
     @staticmethod
     def validate_configuration(config: WorkflowConfig) -> None:
@@ -83,54 +156,74 @@ class ConfigLoader:
         Raises:
             ConfigurationError: If validation fails
         """
-        # Check that all task agents are defined
         agent_names = {agent.name for agent in config.agents}
-        for task in config.tasks:
-            if task.agent_name not in agent_names:
-                raise ConfigurationError(
-                    f"Task '{task.name}' references undefined agent '{task.agent_name}'"
-                )
-        
-        # Check task dependencies
         task_names = {task.name for task in config.tasks}
-        for task in config.tasks:
-            for dependency in task.depends_on:
-                if dependency not in task_names:
-                    raise ConfigurationError(
-                        f"Task '{task.name}' depends on undefined task '{dependency}'"
-                    )
+        missing_agents = {task.agent_name for task in config.tasks} - agent_names
+        missing_tasks = {dep for task in config.tasks for dep in task.depends_on} - task_names
+        
+        # Report every undefined agent and task reference at once
+        if missing_agents or missing_tasks:
+            errors = [
+                f"Task '{task.name}' references undefined agent '{task.agent_name}'"
+                for task in config.tasks
+                if task.agent_name in missing_agents
+            ]
+            errors += [
+                f"Task '{task.name}' depends on undefined task '{dependency}'"
+                for task in config.tasks
+                for dependency in task.depends_on
+                if dependency in missing_tasks
+            ]
+            raise ConfigurationError("; ".join(errors))
         
         # Check for circular dependencies
-        ConfigLoader._check_circular_dependencies(config.tasks)
+        ConfigLoader._topological_order(config.dependency_graph)
     
     @staticmethod
-    def _check_circular_dependencies(tasks: list) -> None:
+    def _check_circular_dependencies(tasks: list) -> List[str]:
         """Check for circular dependencies in tasks.
         
         Args:
             tasks: List of task configurations
             
+        Returns:
+            List[str]: Task names in dependency order
+            
         Raises:
             ConfigurationError: If circular dependencies are found
         """
-        task_deps = {task.name: set(task.depends_on) for task in tasks}
+        return ConfigLoader._topological_order(build_dependency_graph(tasks))
+    
+    @staticmethod
+    def _topological_order(graph: DependencyGraph) -> List[str]:
+        """Order tasks so that each comes after its dependencies.
         
-        def has_cycle(task_name: str, visited: set, rec_stack: set) -> bool:
-            visited.add(task_name)
-            rec_stack.add(task_name)
+        Uses Kahn's algorithm, which detects cycles in the same pass.
+        
+        Args:
+            graph: Task dependency graph
             
-            for dep in task_deps.get(task_name, set()):
-                if dep not in visited:
-                    if has_cycle(dep, visited, rec_stack):
-                        return True
-                elif dep in rec_stack:
-                    return True
+        Returns:
+            List[str]: Task names in dependency order
             
-            rec_stack.remove(task_name)
-            return False
-        
-        visited = set()
-        for task in tasks:
-            if task.name not in visited:
-                if has_cycle(task.name, visited, set()):
-                    raise ConfigurationError("Circular dependency detected in tasks")
+        Raises:
+            ConfigurationError: If circular dependencies are found
+        """
+        in_degree = array("i", graph.in_degree)
+        offsets = graph.offsets
+        dependents = graph.dependents
+        
+        ready = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        order = []
+        while ready:
+            i = ready.popleft()
+            order.append(i)
+            for dependent in dependents[offsets[i]:offsets[i + 1]]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+        
+        if len(order) < len(in_degree):
+            raise ConfigurationError("Circular dependency detected in tasks")
+        
+        return [graph.names[i] for i in order]
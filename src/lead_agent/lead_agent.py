@@ -1,12 +1,14 @@
 """Main Lead Agent class."""
 
 import asyncio
-from pathlib import Path
-from typing import Optional
+import sys
+from typing import Optional, Union
 
+import orjson
 import structlog
 
-from .models import WorkflowResult
+from .agents.base import BaseAgent
+from .models import WorkflowConfig, WorkflowResult
 from .workflow.engine import WorkflowEngine
 
 logger = structlog.get_logger(__name__)
@@ -35,23 +37,59 @@ class LeadAgent:
             await self.workflow_engine.load_workflow(config_path)
             
             # Execute workflow
-            result = await self.workflow_engine.execute_workflow()
+            return await self._run_loaded_workflow()
             
-            logger.info(
-                "Workflow execution completed",
-                workflow_id=result.workflow_id,
-                status=result.status,
-                completed_tasks=result.completed_tasks,
-                failed_tasks=result.failed_tasks,
-                execution_time=result.execution_time
-            )
+        except Exception as e:
+            logger.error("Workflow execution failed", error=str(e))
+            raise
+    
+    async def execute_workflow(
+        self,
+        workflow_config: Union[WorkflowConfig, dict]
+    ) -> WorkflowResult:
+        """Execute a workflow from an in-memory configuration.
+        
+        Args:
+            workflow_config: Workflow configuration or its dictionary form
             
-            return result
+        Returns:
+            WorkflowResult: Result of workflow execution
+        """
+        logger.info("Starting workflow execution")
+        
+        try:
+            # Load workflow configuration
+            if isinstance(workflow_config, WorkflowConfig):
+                await self.workflow_engine.load_workflow_config(workflow_config)
+            else:
+                await self.workflow_engine.load_workflow_from_dict(workflow_config)
+            
+            # Execute workflow
+            return await self._run_loaded_workflow()
             
         except Exception as e:
             logger.error("Workflow execution failed", error=str(e))
             raise
     
+    async def _run_loaded_workflow(self) -> WorkflowResult:
+        """Execute the workflow currently loaded in the engine.
+        
+        Returns:
+            WorkflowResult: Result of workflow execution
+        """
+        result = await self.workflow_engine.execute_workflow()
+        
+        logger.info(
+            "Workflow execution completed",
+            workflow_id=result.workflow_id,
+            status=result.status,
+            completed_tasks=result.completed_tasks,
+            failed_tasks=result.failed_tasks,
+            execution_time=result.execution_time
+        )
+        
+        return result
+    
     async def execute_workflow_from_dict(self, config_dict: dict) -> WorkflowResult:
         """Execute a workflow from configuration dictionary.
         
@@ -61,32 +99,21 @@ class LeadAgent:
         Returns:
             WorkflowResult: Result of workflow execution
         """
-        # Save config to temporary file and use file-based execution
-        # In a production system, you might want to extend the engine
-        # to accept dict directly
-        import tempfile
-        import json
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_dict, f, indent=2)
-            temp_path = f.name
-        
-        try:
-            return await self.execute_workflow_from_file(temp_path)
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        return await self.execute_workflow(config_dict)
 
 
 async def main() -> None:
     """Main entry point for CLI usage."""
-    import sys
-    
     if len(sys.argv) != 2:
         print("Usage: python -m lead_agent.lead_agent <config_file>")
         sys.exit(1)
     
     config_path = sys.argv[1]
     
+    # Let tasks that finish without awaiting complete inline (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     # Configure logging
     structlog.configure(
         processors=[
@@ -97,7 +124,10 @@ async def main() -> None:
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer()
+            # orjson returns bytes, the stdlib logging backend expects str
+            structlog.processors.JSONRenderer(
+                serializer=lambda obj, **kwargs: orjson.dumps(obj, **kwargs).decode()
+            )
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -126,7 +156,16 @@ async def main() -> None:
     except Exception as e:
         print(f"Workflow execution failed: {e}")
         sys.exit(1)
+    finally:
+        await BaseAgent.close_session()
 
 
 if __name__ == "__main__":
+    # uvloop is optional and not available on Windows
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     asyncio.run(main())
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import uuid
+from array import array
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from functools import cached_property
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class TaskStatus(str, Enum):
@@ -40,6 +42,8 @@ class AgentType(str, Enum):
 
 class RetryConfig(BaseModel):
     """Configuration for retry logic."""
+    model_config = ConfigDict(frozen=True)
+    
     max_attempts: int = Field(default=3, ge=1, le=10)
     initial_delay: float = Field(default=1.0, ge=0.1)
     max_delay: float = Field(default=60.0, ge=1.0)
@@ -49,6 +53,8 @@ class RetryConfig(BaseModel):
 
 class CircuitBreakerConfig(BaseModel):
     """Configuration for circuit breaker pattern."""
+    model_config = ConfigDict(frozen=True)
+    
     failure_threshold: int = Field(default=5, ge=1)
     recovery_timeout: float = Field(default=60.0, ge=1.0)
     expected_exception: Optional[str] = None
@@ -56,6 +62,8 @@ class CircuitBreakerConfig(BaseModel):
 
 class AgentConfig(BaseModel):
     """Configuration for an agent."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     type: AgentType
     endpoint: Optional[str] = None
@@ -68,6 +76,8 @@ class AgentConfig(BaseModel):
 
 class TaskConfig(BaseModel):
     """Configuration for a task."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     description: Optional[str] = None
     agent_name: str
@@ -79,8 +89,70 @@ class TaskConfig(BaseModel):
     continue_on_failure: bool = Field(default=False)
 
 
+class DependencyGraph(NamedTuple):
+    """Task dependency graph in compressed sparse row form.
+    
+    Tasks are numbered by first appearance. The tasks that depend on task
+    ``i`` are ``dependents[offsets[i]:offsets[i + 1]]`` and ``in_degree[i]``
+    is the number of distinct tasks it depends on. Dependencies on
+    undefined tasks are left out.
+    """
+    names: List[str]
+    index: Dict[str, int]
+    in_degree: array
+    offsets: array
+    dependents: array
+
+
+def build_dependency_graph(tasks: Sequence[TaskConfig]) -> DependencyGraph:
+    """Pack task dependencies into a DependencyGraph.
+    
+    Args:
+        tasks: Task configurations
+        
+    Returns:
+        DependencyGraph: Dependency graph of the tasks
+    """
+    index: Dict[str, int] = {}
+    for task in tasks:
+        index.setdefault(task.name, len(index))
+    
+    dependencies: List[set] = [set() for _ in index]
+    for task in tasks:
+        dependencies[index[task.name]].update(
+            index[dep] for dep in task.depends_on if dep in index
+        )
+    
+    counts = [0] * len(index)
+    for deps in dependencies:
+        for dep in deps:
+            counts[dep] += 1
+    
+    offsets = array("i", [0])
+    for count in counts:
+        offsets.append(offsets[-1] + count)
+    
+    # Fill each task's slice; dependents end up in ascending index order
+    dependents = array("i", [0]) * offsets[-1]
+    fill = offsets[:-1]
+    for i, deps in enumerate(dependencies):
+        for dep in deps:
+            dependents[fill[dep]] = i
+            fill[dep] += 1
+    
+    return DependencyGraph(
+        names=list(index),
+        index=index,
+        in_degree=array("i", (len(deps) for deps in dependencies)),
+        offsets=offsets,
+        dependents=dependents
+    )
+
+
 class WorkflowConfig(BaseModel):
     """Configuration for a workflow."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     description: Optional[str] = None
     version: str = Field(default="1.0.0")
@@ -102,6 +174,11 @@ class WorkflowConfig(BaseModel):
         if v not in valid_strategies:
             raise ValueError(f"Invalid failure strategy: {v}")
         return v
+    
+    @cached_property
+    def dependency_graph(self) -> DependencyGraph:
+        """Task dependency graph, built once per configuration."""
+        return build_dependency_graph(self.tasks)
 
 
 class TaskExecution(BaseModel):
@@ -113,12 +190,15 @@ class TaskExecution(BaseModel):
     end_time: Optional[datetime] = None
     attempts: int = 0
     max_attempts: int = 3
+    timeout: float = 30.0
+    continue_on_failure: bool = False
     result: Optional[Any] = None
     error: Optional[str] = None
     dependencies_completed: bool = False
     agent_name: str
     action: str
     parameters: Dict[str, Any] = Field(default_factory=dict)
+    depends_on: List[str] = Field(default_factory=list)
 
 
 class WorkflowExecution(BaseModel):
@@ -14,6 +14,12 @@ class CircuitBreakerState(Enum):
     HALF_OPEN = "half_open"
 
 
+# Module-level aliases skip the enum class lookups on every state check
+_CLOSED = CircuitBreakerState.CLOSED
+_OPEN = CircuitBreakerState.OPEN
+_HALF_OPEN = CircuitBreakerState.HALF_OPEN
+
+
 class CircuitBreaker:
     """Circuit breaker implementation for handling cascading failures."""
     
@@ -24,10 +30,12 @@ class CircuitBreaker:
             config: Circuit breaker configuration
         """
         self.config = config
-        self.state = CircuitBreakerState.CLOSED
+        self.state = _CLOSED
         self.failure_count = 0
-        self.last_failure_time: Optional[float] = None
+        # Monotonic clock reading in nanoseconds, unaffected by clock changes
+        self.last_failure_time: Optional[int] = None
         self.success_count = 0
+        self._recovery_timeout_ns = int(config.recovery_timeout * 1_000_000_000)
     
     def can_execute(self) -> bool:
         """Check if execution is allowed.
@@ -35,12 +43,14 @@ class CircuitBreaker:
         Returns:
             True if execution is allowed, False otherwise
         """
-        if self.state == CircuitBreakerState.CLOSED:
+        # The common CLOSED case is a single identity check, which is
+        # cheaper than dispatching through a per-state table of methods
+        if self.state is _CLOSED:
             return True
         
-        if self.state == CircuitBreakerState.OPEN:
+        if self.state is _OPEN:
             if self._should_attempt_reset():
-                self.state = CircuitBreakerState.HALF_OPEN
+                self.state = _HALF_OPEN
                 self.success_count = 0
                 return True
             return False
@@ -50,24 +60,24 @@ class CircuitBreaker:
     
     def record_success(self) -> None:
         """Record a successful execution."""
-        if self.state == CircuitBreakerState.HALF_OPEN:
+        if self.state is _HALF_OPEN:
             self.success_count += 1
             if self.success_count >= 1:  # Reset after first success in half-open
                 self._reset()
-        elif self.state == CircuitBreakerState.CLOSED:
+        elif self.state is _CLOSED:
             # Reset failure count on success
             self.failure_count = 0
     
     def record_failure(self) -> None:
         """Record a failed execution."""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic_ns()
         
-        if self.state == CircuitBreakerState.HALF_OPEN:
-            self.state = CircuitBreakerState.OPEN
-        elif (self.state == CircuitBreakerState.CLOSED and 
+        if self.state is _HALF_OPEN:
+            self.state = _OPEN
+        elif (self.state is _CLOSED and 
               self.failure_count >= self.config.failure_threshold):
-            self.state = CircuitBreakerState.OPEN
+            self.state = _OPEN
     
     def _should_attempt_reset(self) -> bool:
         """Check if circuit breaker should attempt reset.
@@ -78,11 +88,11 @@ class CircuitBreaker:
         if self.last_failure_time is None:
             return True
         
-        return (time.time() - self.last_failure_time) >= self.config.recovery_timeout
+        return (time.monotonic_ns() - self.last_failure_time) >= self._recovery_timeout_ns
     
     def _reset(self) -> None:
         """Reset circuit breaker to closed state."""
-        self.state = CircuitBreakerState.CLOSED
+        self.state = _CLOSED
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time = None
@@ -90,14 +100,14 @@ class CircuitBreaker:
     @property
     def is_open(self) -> bool:
         """Check if circuit breaker is open."""
-        return self.state == CircuitBreakerState.OPEN
+        return self.state is _OPEN
     
     @property
     def is_closed(self) -> bool:
         """Check if circuit breaker is closed."""
-        return self.state == CircuitBreakerState.CLOSED
+        return self.state is _CLOSED
     
     @property
     def is_half_open(self) -> bool:
         """Check if circuit breaker is half-open."""
-        return self.state == CircuitBreakerState.HALF_OPEN
+        return self.state is _HALF_OPEN
@@ -1,7 +1,12 @@
 """Observer pattern implementation for event handling."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
 
 
 class Observer(ABC):
@@ -24,7 +29,10 @@ class Subject:
     
     def __init__(self) -> None:
         """Initialize subject."""
-        self._observers: List[Observer] = []
+        # Observers in attach order, mapped to their bound update methods
+        self._observers: Dict[Observer, Callable[..., Awaitable[None]]] = {}
+        # Snapshot of the update methods, rebuilt only on attach/detach
+        self._callbacks: Tuple[Callable[..., Awaitable[None]], ...] = ()
     
     def attach(self, observer: Observer) -> None:
         """Attach an observer.
@@ -33,7 +41,8 @@ class Subject:
             observer: Observer to attach
         """
         if observer not in self._observers:
-            self._observers.append(observer)
+            self._observers[observer] = observer.update
+            self._callbacks = tuple(self._observers.values())
     
     def detach(self, observer: Observer) -> None:
         """Detach an observer.
@@ -41,19 +50,36 @@ class Subject:
         Args:
             observer: Observer to detach
         """
-        if observer in self._observers:
-            self._observers.remove(observer)
+        if self._observers.pop(observer, None) is not None:
+            self._callbacks = tuple(self._observers.values())
     
     async def notify(self, event_type: str, data: Any = None) -> None:
         """Notify all observers of an event.
         
+        Observers are updated concurrently, so a slow observer does not
+        delay the others. A failing observer does not stop the rest from
+        being notified.
+        
         Args:
             event_type: Type of event
             data: Event data
         """
-        for observer in self._observers:
+        callbacks = self._callbacks
+        if not callbacks:
+            return
+        
+        if len(callbacks) == 1:
+            # A single observer is awaited directly to skip creating tasks
             try:
-                await observer.update(self, event_type, data)
-            except Exception:
-                # Continue notifying other observers even if one fails
-                pass
+                await callbacks[0](self, event_type, data)
+            except Exception as e:
+                logger.debug("Observer update failed", event_type=event_type, error=str(e))
+            return
+        
+        results = await asyncio.gather(
+            *(callback(self, event_type, data) for callback in callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug("Observer update failed", event_type=event_type, error=str(result))
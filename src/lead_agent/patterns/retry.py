@@ -25,6 +25,14 @@ class RetryHandler:
             config: Retry configuration
         """
         self.config = config
+        
+        # Backoff schedule for every attempt the config allows,
+        # computed once instead of on each retry
+        self._delays = tuple(
+            self._backoff_delay(attempt) for attempt in range(config.max_attempts)
+        )
+        # Width of the +/-10% jitter band around each delay
+        self._jitter_ranges = tuple(delay * 0.1 for delay in self._delays)
     
     async def execute_with_retry(
         self,
@@ -46,13 +54,14 @@ class RetryHandler:
             RetryExhaustedException: If all retry attempts fail
         """
         last_exception = None
+        # The function kind cannot change between attempts
+        is_coroutine = asyncio.iscoroutinefunction(func)
         
         for attempt in range(self.config.max_attempts):
             try:
-                if asyncio.iscoroutinefunction(func):
+                if is_coroutine:
                     return await func(*args, **kwargs)
-                else:
-                    return func(*args, **kwargs)
+                return func(*args, **kwargs)
                     
             except Exception as e:
                 last_exception = e
@@ -80,18 +89,32 @@ class RetryHandler:
         Returns:
             Delay in seconds
         """
+        if attempt < len(self._delays):
+            delay = self._delays[attempt]
+            jitter_range = self._jitter_ranges[attempt]
+        else:
+            delay = self._backoff_delay(attempt)
+            jitter_range = delay * 0.1  # 10% jitter
+        
+        # Add jitter to avoid thundering herd
+        if self.config.jitter:
+            delay += (random.random() * 2 - 1) * jitter_range
+        
+        return max(0, delay)  # Ensure non-negative delay
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """Calculate the capped exponential backoff for an attempt.
+        
+        Args:
+            attempt: Attempt number (0-based)
+            
+        Returns:
+            Delay in seconds, without jitter
+        """
         # Exponential backoff: initial_delay * (base ^ attempt)
         delay = self.config.initial_delay * (
             self.config.exponential_base ** attempt
         )
         
         # Cap at max_delay
-        delay = min(delay, self.config.max_delay)
-        
-        # Add jitter to avoid thundering herd
-        if self.config.jitter:
-            jitter_range = delay * 0.1  # 10% jitter
-            jitter = random.uniform(-jitter_range, jitter_range)
-            delay += jitter
-        
-        return max(0, delay)  # Ensure non-negative delay
+        return min(delay, self.config.max_delay)
@@ -1,9 +1,13 @@
 """Main workflow execution engine."""
 
 import asyncio
+import graphlib
+import logging
+import os
 import time
+import uuid
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
 
 import structlog
 
@@ -19,6 +23,59 @@ from .state_machine import WorkflowStateMachine
 
 logger = structlog.get_logger(__name__)
 
+# asyncio.eager_task_factory() is only available on Python 3.12+
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+
+
+def _start_task(coro: Coroutine) -> asyncio.Future:
+    """Wrap a coroutine in a task, starting it eagerly where supported.
+    
+    Eager tasks run until their first suspension point before returning,
+    so coroutines that finish without awaiting I/O complete inline instead
+    of waiting for a turn of the event loop.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        asyncio.Future: Task running the coroutine
+    """
+    if _EAGER_TASK_FACTORY is None:
+        return asyncio.ensure_future(coro)
+    return _EAGER_TASK_FACTORY(asyncio.get_running_loop(), coro)
+
+
+def _logs_info(bound_logger: Any) -> bool:
+    """Check whether a logger would emit INFO records.
+    
+    structlog's native loggers already drop filtered calls for free; stdlib
+    backed ones run the processor chain first unless checked up front.
+    
+    Args:
+        bound_logger: structlog logger
+        
+    Returns:
+        bool: True if INFO records are emitted
+    """
+    is_enabled_for = getattr(bound_logger, "isEnabledFor", None)
+    return is_enabled_for is None or is_enabled_for(logging.INFO)
+
+
+def _batch_uuids(n: int) -> List[str]:
+    """Generate random version 4 UUIDs from a single entropy read.
+    
+    Args:
+        n: Number of UUIDs to generate
+        
+    Returns:
+        List[str]: UUID strings
+    """
+    data = os.urandom(16 * n)
+    return [
+        str(uuid.UUID(bytes=data[i:i + 16], version=4))
+        for i in range(0, 16 * n, 16)
+    ]
+
 
 class WorkflowEngine(Observer):
     """Main engine for executing workflows."""
@@ -30,6 +87,11 @@ class WorkflowEngine(Observer):
         self.state_machine: Optional[WorkflowStateMachine] = None
         self.workflow_config: Optional[WorkflowConfig] = None
         self.workflow_execution: Optional[WorkflowExecution] = None
+        # Set by the state machine notifications when the workflow finishes
+        self._done_event: Optional[asyncio.Event] = None
+        # Logger for workflow events, bound to the running workflow
+        self._logger = logger
+        self._log_events = _logs_info(logger)
     
     async def load_workflow(self, config_path: str) -> None:
         """Load workflow configuration from file.
@@ -38,9 +100,37 @@ class WorkflowEngine(Observer):
             config_path: Path to workflow configuration file
         """
         try:
-            # Load and validate configuration
-            self.workflow_config = ConfigLoader.load_from_file(config_path)
-            ConfigLoader.validate_configuration(self.workflow_config)
+            config = ConfigLoader.load_from_file(config_path)
+        except Exception as e:
+            logger.error("Failed to load workflow", error=str(e))
+            raise
+        
+        await self.load_workflow_config(config)
+    
+    async def load_workflow_from_dict(self, config_dict: Dict[str, Any]) -> None:
+        """Load workflow configuration from a dictionary.
+        
+        Args:
+            config_dict: Workflow configuration as dictionary
+        """
+        try:
+            config = ConfigLoader.load_from_dict(config_dict)
+        except Exception as e:
+            logger.error("Failed to load workflow", error=str(e))
+            raise
+        
+        await self.load_workflow_config(config)
+    
+    async def load_workflow_config(self, config: WorkflowConfig) -> None:
+        """Load an already parsed workflow configuration.
+        
+        Args:
+            config: Workflow configuration
+        """
+        try:
+            # Validate configuration
+            ConfigLoader.validate_configuration(config)
+            self.workflow_config = config
             
             # Create agents
             self.agents = {}
@@ -69,8 +159,12 @@ class WorkflowEngine(Observer):
         start_time = time.time()
         
         try:
+            # IDs for the workflow and each of its tasks
+            ids = _batch_uuids(len(self.workflow_config.tasks) + 1)
+            
             # Create workflow execution instance
             self.workflow_execution = WorkflowExecution(
+                workflow_id=ids[-1],
                 name=self.workflow_config.name,
                 total_tasks=len(self.workflow_config.tasks),
                 partial_completion_allowed=(
@@ -78,19 +172,35 @@ class WorkflowEngine(Observer):
                 )
             )
             
-            # Create task executions
-            for task_config in self.workflow_config.tasks:
+            self._logger = logger.bind(
+                workflow_id=self.workflow_execution.workflow_id,
+                workflow=self.workflow_config.name
+            )
+            self._log_events = _logs_info(self._logger)
+            
+            # Create task executions. The validating constructor runs in
+            # pydantic-core and is cheaper than model_construct() for a
+            # model with this many defaulted fields
+            for task_id, task_config in zip(ids, self.workflow_config.tasks):
                 task_execution = TaskExecution(
+                    task_id=task_id,
                     name=task_config.name,
                     agent_name=task_config.agent_name,
                     action=task_config.action,
                     parameters=task_config.parameters,
-                    max_attempts=task_config.retry_config.max_attempts
+                    max_attempts=task_config.retry_config.max_attempts,
+                    timeout=task_config.timeout,
+                    continue_on_failure=task_config.continue_on_failure,
+                    depends_on=task_config.depends_on
                 )
                 self.workflow_execution.tasks.append(task_execution)
             
             # Create state machine and attach observers
-            self.state_machine = WorkflowStateMachine(self.workflow_execution)
+            self._done_event = asyncio.Event()
+            # Tasks mirror the configuration, so its cached graph is reused
+            self.state_machine = WorkflowStateMachine(
+                self.workflow_execution, self.workflow_config.dependency_graph
+            )
             self.state_machine.attach(self)
             
             # Start workflow execution
@@ -106,16 +216,19 @@ class WorkflowEngine(Observer):
             await self._wait_for_completion()
             
             execution_time = time.time() - start_time
+            results, errors = self._collect_outputs()
             
-            return WorkflowResult(
+            # Every value comes from the engine, so validation, which would
+            # copy the results and errors dicts entry by entry, is skipped
+            return WorkflowResult.model_construct(
                 workflow_id=self.workflow_execution.workflow_id,
                 status=self.workflow_execution.status,
                 completed_tasks=self.workflow_execution.completed_tasks,
                 failed_tasks=self.workflow_execution.failed_tasks,
                 total_tasks=self.workflow_execution.total_tasks,
                 execution_time=execution_time,
-                results=self._collect_results(),
-                errors=self._collect_errors()
+                results=results,
+                errors=errors
             )
             
         except Exception as e:
@@ -125,32 +238,72 @@ class WorkflowEngine(Observer):
             raise
     
     async def _execute_parallel(self) -> None:
-        """Execute tasks in parallel where possible."""
+        """Execute tasks in parallel as soon as their dependencies finish.
+        
+        Each finished task immediately releases the tasks that depend on it,
+        so independent branches of the graph never wait for each other.
+        """
         logger.info("Starting parallel workflow execution")
         
-        while True:
-            # Get ready tasks
-            ready_tasks = self.state_machine.get_ready_tasks()
-            retryable_tasks = self.state_machine.get_retryable_tasks()
-            
-            all_tasks = ready_tasks + retryable_tasks
-            
-            if not all_tasks:
-                # No more tasks to execute
-                break
-            
-            # Execute all ready tasks concurrently
-            tasks = [self._execute_single_task(task) for task in all_tasks]
-            await asyncio.gather(*tasks, return_exceptions=True)
+        tasks_by_name = {task.name: task for task in self.workflow_execution.tasks}
+        sorter = graphlib.TopologicalSorter(
+            {task.name: task.depends_on for task in self.workflow_execution.tasks}
+        )
+        sorter.prepare()
+        running: Dict[asyncio.Future, str] = {}
+        
+        try:
+            while sorter.is_active() and self.workflow_execution.status == WorkflowStatus.RUNNING:
+                ready = (tasks_by_name[name] for name in sorter.get_ready())
+                for task in self.state_machine.sort_by_priority(ready):
+                    running[_start_task(self._run_task(task))] = task.name
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    sorter.done(running.pop(future))
+                    # Task failures are recorded by the state machine, so an
+                    # exception here is an engine error and stops the workflow
+                    future.result()
             
-            # Small delay to prevent busy waiting
-            await asyncio.sleep(0.1)
+            # Let tasks already started finish before returning
+            if running:
+                await asyncio.wait(running)
+                for future in running:
+                    future.result()
+        finally:
+            # On errors or cancellation, stop the tasks still in flight
+            pending = [future for future in running if not future.done()]
+            for future in pending:
+                future.cancel()
+            if pending:
+                await asyncio.wait(pending)
+    
+    async def _run_task(self, task: TaskExecution) -> None:
+        """Run a task until it reaches a final state.
+        
+        Tasks whose dependencies did not complete are cancelled.
+        
+        Args:
+            task: Task to run
+        """
+        if not self.state_machine.dependencies_satisfied(task):
+            await self.state_machine.cancel_task(task, "Dependency not completed")
+            return
+        
+        await self._execute_single_task(task)
+        while (task.status == TaskStatus.RETRYING and
+               self.workflow_execution.status == WorkflowStatus.RUNNING):
+            await self._execute_single_task(task)
     
     async def _execute_sequential(self) -> None:
-        """Execute tasks sequentially based on dependencies."""
+        """Execute tasks sequentially based on dependencies.
+        
+        Once no task is left to run, pending tasks whose dependencies did
+        not complete are cancelled, as in parallel execution.
+        """
         logger.info("Starting sequential workflow execution")
         
-        while True:
+        while self.workflow_execution.status == WorkflowStatus.RUNNING:
             # Get ready tasks (should be one at a time for sequential)
             ready_tasks = self.state_machine.get_ready_tasks()
             retryable_tasks = self.state_machine.get_retryable_tasks()
@@ -164,9 +317,14 @@ class WorkflowEngine(Observer):
             # Execute one task at a time
             for task in all_tasks[:1]:  # Take only first task for sequential
                 await self._execute_single_task(task)
-            
-            # Small delay to prevent busy waiting
-            await asyncio.sleep(0.1)
+        
+        # Any task still pending waits on a dependency that did not
+        # complete, so it can never start
+        if self.workflow_execution.status == WorkflowStatus.RUNNING:
+            for task in self.workflow_execution.tasks:
+                if (task.status == TaskStatus.PENDING and
+                        not self.state_machine.dependencies_satisfied(task)):
+                    await self.state_machine.cancel_task(task, "Dependency not completed")
     
     async def _execute_single_task(self, task: TaskExecution) -> None:
         """Execute a single task.
@@ -191,39 +349,33 @@ class WorkflowEngine(Observer):
     
     async def _wait_for_completion(self) -> None:
         """Wait for workflow completion or timeout."""
-        timeout = self.workflow_config.global_timeout
-        start_time = time.time()
+        if self.workflow_execution.status != WorkflowStatus.RUNNING:
+            return
         
-        while self.workflow_execution.status == WorkflowStatus.RUNNING:
-            if timeout and (time.time() - start_time) > timeout:
-                await self.state_machine.fail_workflow("Workflow timeout")
-                break
-            
-            await asyncio.sleep(0.5)
+        try:
+            await asyncio.wait_for(
+                self._done_event.wait(),
+                timeout=self.workflow_config.global_timeout or None
+            )
+        except asyncio.TimeoutError:
+            await self.state_machine.fail_workflow("Workflow timeout")
     
-    def _collect_results(self) -> Dict[str, any]:
-        """Collect results from completed tasks.
+    def _collect_outputs(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Collect results from completed tasks and errors from failed ones.
         
         Returns:
-            Dictionary of task results
+            Tuple of task results and task errors, keyed by task name
         """
         results = {}
-        for task in self.workflow_execution.tasks:
-            if task.status == TaskStatus.COMPLETED and task.result is not None:
-                results[task.name] = task.result
-        return results
-    
-    def _collect_errors(self) -> Dict[str, str]:
-        """Collect errors from failed tasks.
-        
-        Returns:
-            Dictionary of task errors
-        """
         errors = {}
         for task in self.workflow_execution.tasks:
-            if task.status == TaskStatus.FAILED and task.error:
+            status = task.status
+            if status is TaskStatus.COMPLETED:
+                if task.result is not None:
+                    results[task.name] = task.result
+            elif status is TaskStatus.FAILED and task.error:
                 errors[task.name] = task.error
-        return errors
+        return results, errors
     
     async def update(self, subject, event_type: str, data: any) -> None:
         """Handle notifications from state machine.
@@ -233,4 +385,8 @@ class WorkflowEngine(Observer):
             event_type: Type of event
             data: Event data
         """
-        logger.info("Workflow event", event=event_type, data=data)
+        if event_type in ("workflow_completed", "workflow_failed") and self._done_event:
+            self._done_event.set()
+        
+        if self._log_events:
+            self._logger.info("Workflow event", event_type=event_type, data=data)
@@ -1,32 +1,183 @@
 """State machine for workflow execution."""
 
+from array import array
 from datetime import datetime, timezone
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List, Optional
 
-from ..models import TaskExecution, TaskStatus, WorkflowExecution, WorkflowStatus
+from ..models import (
+    DependencyGraph, TaskExecution, TaskStatus, WorkflowExecution, WorkflowStatus,
+    build_dependency_graph
+)
 from ..patterns.observer import Subject
 
 
+# Module-level aliases skip the enum class lookups on every transition
+_PENDING = TaskStatus.PENDING
+_RUNNING = TaskStatus.RUNNING
+_COMPLETED = TaskStatus.COMPLETED
+_FAILED = TaskStatus.FAILED
+_CANCELLED = TaskStatus.CANCELLED
+_RETRYING = TaskStatus.RETRYING
+
+_STARTABLE = frozenset({_PENDING, _RETRYING})
+_COMPLETABLE = frozenset({_RUNNING, _RETRYING})
+
+
 class WorkflowStateMachine(Subject):
     """State machine for managing workflow execution state."""
     
-    def __init__(self, workflow_execution: WorkflowExecution):
+    def __init__(
+        self,
+        workflow_execution: WorkflowExecution,
+        graph: Optional[DependencyGraph] = None
+    ):
         """Initialize state machine.
         
         Args:
             workflow_execution: Workflow execution instance to manage
+            graph: Prebuilt dependency graph of the workflow's tasks, built
+                from the tasks when not given
         """
         super().__init__()
         self.workflow_execution = workflow_execution
-        self._task_dependencies: Dict[str, Set[str]] = {}
-        self._build_dependency_graph()
+        # Number of tasks in each status, kept current by _set_task_status
+        self._status_counts: Dict[TaskStatus, int] = dict.fromkeys(TaskStatus, 0)
+        # Tasks waiting for a retry, keyed by id() as models are unhashable
+        self._retrying: Dict[int, TaskExecution] = {}
+        for task in workflow_execution.tasks:
+            self._status_counts[task.status] += 1
+            if task.status is _RETRYING:
+                self._retrying[id(task)] = task
+        self._build_dependency_graph(graph)
     
-    def _build_dependency_graph(self) -> None:
-        """Build task dependency graph."""
-        for task in self.workflow_execution.tasks:
-            # For now, we'll assume dependencies are stored in task metadata
-            # In a real implementation, this would come from the task configuration
-            self._task_dependencies[task.name] = set()
+    def _build_dependency_graph(self, graph: Optional[DependencyGraph] = None) -> None:
+        """Build task dependency graph.
+        
+        Each task tracks how many of its dependencies have not completed
+        yet. Completing a task decrements the counters of its dependents,
+        so ready tasks are known without rescanning the whole workflow.
+        Dependencies on undefined tasks never complete.
+        
+        Args:
+            graph: Prebuilt dependency graph, built from the tasks when not
+                given
+        """
+        tasks = self.workflow_execution.tasks
+        self._graph = graph if graph is not None else build_dependency_graph(tasks)
+        index = self._graph.index
+        
+        self._tasks_by_index: List[TaskExecution] = [None] * len(index)
+        for task in reversed(tasks):
+            self._tasks_by_index[index[task.name]] = task
+        
+        self._remaining: List[int] = list(self._graph.in_degree)
+        for task in tasks:
+            if task.depends_on:
+                self._remaining[index[task.name]] += sum(
+                    1 for dep in set(task.depends_on) if dep not in index
+                )
+        for i, task in enumerate(self._tasks_by_index):
+            if task.status is _COMPLETED:
+                for dep in self._dependents_of(i):
+                    self._remaining[dep] -= 1
+        
+        # Pending tasks whose dependencies are all completed
+        self._ready = {
+            i for i, remaining in enumerate(self._remaining)
+            if remaining == 0 and self._tasks_by_index[i].status is _PENDING
+        }
+        self._compute_priorities()
+    
+    def _compute_priorities(self) -> None:
+        """Rank tasks by the length of their critical path.
+        
+        A task's critical path is its own timeout plus the longest chain of
+        timeouts among the tasks that depend on it, directly or not. Tasks
+        heading longer chains are started first, ties keep workflow order.
+        """
+        graph = self._graph
+        if not graph.dependents:
+            # Without dependencies each critical path is the task's own timeout
+            self._priority = [(-task.timeout, i) for i, task in enumerate(self._tasks_by_index)]
+            return
+        
+        in_degree = list(graph.in_degree)
+        order = [i for i, degree in enumerate(in_degree) if degree == 0]
+        for i in order:
+            for dep in self._dependents_of(i):
+                in_degree[dep] -= 1
+                if in_degree[dep] == 0:
+                    order.append(dep)
+        
+        # Tasks on a cycle never enter the order and keep their own weight
+        critical_path = [task.timeout for task in self._tasks_by_index]
+        for i in reversed(order):
+            critical_path[i] += max(
+                (critical_path[dep] for dep in self._dependents_of(i)), default=0.0
+            )
+        
+        self._priority = [(-weight, i) for i, weight in enumerate(critical_path)]
+    
+    def sort_by_priority(self, tasks: Iterable[TaskExecution]) -> List[TaskExecution]:
+        """Order tasks so those on the longest critical path come first.
+        
+        Args:
+            tasks: Tasks to order
+            
+        Returns:
+            List of tasks, highest priority first
+        """
+        index = self._graph.index
+        return sorted(tasks, key=lambda task: self._priority[index[task.name]])
+    
+    def _dependents_of(self, i: int) -> array:
+        """Get the indexes of the tasks that depend on task ``i``."""
+        return self._graph.dependents[self._graph.offsets[i]:self._graph.offsets[i + 1]]
+    
+    def _release_dependents(self, task: TaskExecution) -> None:
+        """Update dependency counters after a task completes.
+        
+        Args:
+            task: Task that completed
+        """
+        i = self._graph.index[task.name]
+        if self._tasks_by_index[i] is not task:
+            # Only the first task with a given name satisfies dependencies
+            return
+        
+        for dep in self._dependents_of(i):
+            self._remaining[dep] -= 1
+            if (self._remaining[dep] == 0
+                    and self._tasks_by_index[dep].status is _PENDING):
+                self._ready.add(dep)
+    
+    def _set_task_status(self, task: TaskExecution, status: TaskStatus) -> None:
+        """Move a task to a new status and update the status counts.
+        
+        Tasks leaving the pending state are dropped from the ready set, so
+        it never has to be rebuilt when polled.
+        
+        Args:
+            task: Task to update
+            status: New status
+        """
+        if task.status is _PENDING:
+            i = self._graph.index[task.name]
+            if self._tasks_by_index[i] is task:
+                self._ready.discard(i)
+        self._status_counts[task.status] -= 1
+        self._status_counts[status] += 1
+        if task.status is _RETRYING:
+            del self._retrying[id(task)]
+        if status is _RETRYING:
+            self._retrying[id(task)] = task
+        task.status = status
+    
+    def _finish_workflow(self) -> None:
+        """Record the end time and final task counts of the workflow."""
+        self.workflow_execution.end_time = datetime.now(timezone.utc)
+        self.workflow_execution.completed_tasks = self._status_counts[_COMPLETED]
+        self.workflow_execution.failed_tasks = self._status_counts[_FAILED]
     
     async def start_workflow(self) -> None:
         """Start workflow execution."""
@@ -44,10 +195,8 @@ class WorkflowStateMachine(Subject):
             return
         
         # Determine final status based on task results
-        failed_tasks = sum(1 for task in self.workflow_execution.tasks 
-                          if task.status == TaskStatus.FAILED)
-        completed_tasks = sum(1 for task in self.workflow_execution.tasks 
-                             if task.status == TaskStatus.COMPLETED)
+        failed_tasks = self._status_counts[_FAILED]
+        completed_tasks = self._status_counts[_COMPLETED]
         
         if failed_tasks == 0:
             self.workflow_execution.status = WorkflowStatus.COMPLETED
@@ -56,25 +205,23 @@ class WorkflowStateMachine(Subject):
         else:
             self.workflow_execution.status = WorkflowStatus.FAILED
         
-        self.workflow_execution.end_time = datetime.now(timezone.utc)
-        self.workflow_execution.completed_tasks = completed_tasks
-        self.workflow_execution.failed_tasks = failed_tasks
+        self._finish_workflow()
         
         await self.notify("workflow_completed", self.workflow_execution)
     
     async def fail_workflow(self, error: str) -> None:
         """Fail workflow execution."""
         self.workflow_execution.status = WorkflowStatus.FAILED
-        self.workflow_execution.end_time = datetime.now(timezone.utc)
+        self._finish_workflow()
         
         await self.notify("workflow_failed", {"workflow": self.workflow_execution, "error": error})
     
     async def start_task(self, task: TaskExecution) -> None:
         """Start task execution."""
-        if task.status != TaskStatus.PENDING:
+        if task.status not in _STARTABLE:
             raise ValueError(f"Task {task.name} is not in pending state")
         
-        task.status = TaskStatus.RUNNING
+        self._set_task_status(task, _RUNNING)
         task.start_time = datetime.now(timezone.utc)
         task.attempts += 1
         
@@ -82,12 +229,13 @@ class WorkflowStateMachine(Subject):
     
     async def complete_task(self, task: TaskExecution, result: any = None) -> None:
         """Complete task execution."""
-        if task.status not in [TaskStatus.RUNNING, TaskStatus.RETRYING]:
+        if task.status not in _COMPLETABLE:
             return
         
-        task.status = TaskStatus.COMPLETED
+        self._set_task_status(task, _COMPLETED)
         task.end_time = datetime.now(timezone.utc)
         task.result = result
+        self._release_dependents(task)
         
         await self.notify("task_completed", task)
         
@@ -102,10 +250,10 @@ class WorkflowStateMachine(Subject):
         
         # Check if we should retry
         if task.attempts < task.max_attempts:
-            task.status = TaskStatus.RETRYING
+            self._set_task_status(task, _RETRYING)
             await self.notify("task_retry", task)
         else:
-            task.status = TaskStatus.FAILED
+            self._set_task_status(task, _FAILED)
             await self.notify("task_failed", task)
             
             # Check if workflow should fail
@@ -114,19 +262,31 @@ class WorkflowStateMachine(Subject):
             elif self._all_tasks_finished():
                 await self.complete_workflow()
     
+    async def cancel_task(self, task: TaskExecution, reason: str) -> None:
+        """Cancel a task that can no longer run."""
+        if task.status is not _PENDING:
+            return
+        
+        self._set_task_status(task, _CANCELLED)
+        task.error = reason
+        task.end_time = datetime.now(timezone.utc)
+        
+        await self.notify("task_cancelled", task)
+        
+        # Check if workflow can be completed
+        if self._all_tasks_finished():
+            await self.complete_workflow()
+    
     def get_ready_tasks(self) -> List[TaskExecution]:
         """Get tasks that are ready to execute.
         
         Returns:
             List of tasks ready for execution
         """
-        ready_tasks = []
-        
-        for task in self.workflow_execution.tasks:
-            if task.status == TaskStatus.PENDING and self._dependencies_satisfied(task):
-                ready_tasks.append(task)
-        
-        return ready_tasks
+        return [
+            self._tasks_by_index[i]
+            for i in sorted(self._ready, key=self._priority.__getitem__)
+        ]
     
     def get_retryable_tasks(self) -> List[TaskExecution]:
         """Get tasks that are ready for retry.
@@ -134,28 +294,23 @@ class WorkflowStateMachine(Subject):
         Returns:
             List of tasks ready for retry
         """
-        return [task for task in self.workflow_execution.tasks 
-                if task.status == TaskStatus.RETRYING]
+        return list(self._retrying.values())
     
-    def _dependencies_satisfied(self, task: TaskExecution) -> bool:
+    def dependencies_satisfied(self, task: TaskExecution) -> bool:
         """Check if task dependencies are satisfied.
         
+        A task whose dependencies have all finished without being satisfied
+        can never run and should be cancelled.
+        
         Args:
             task: Task to check
             
         Returns:
-            True if dependencies are satisfied
+            True if all dependencies of the task have completed
         """
-        dependencies = self._task_dependencies.get(task.name, set())
-        
-        for dep_name in dependencies:
-            dep_task = self._get_task_by_name(dep_name)
-            if not dep_task or dep_task.status != TaskStatus.COMPLETED:
-                return False
-        
-        return True
+        return self._remaining[self._graph.index[task.name]] == 0
     
-    def _get_task_by_name(self, name: str) -> TaskExecution:
+    def _get_task_by_name(self, name: str) -> Optional[TaskExecution]:
         """Get task by name.
         
         Args:
@@ -164,10 +319,8 @@ class WorkflowStateMachine(Subject):
         Returns:
             Task execution instance or None
         """
-        for task in self.workflow_execution.tasks:
-            if task.name == name:
-                return task
-        return None
+        i = self._graph.index.get(name)
+        return self._tasks_by_index[i] if i is not None else None
     
     def _all_tasks_finished(self) -> bool:
         """Check if all tasks are finished.
@@ -175,8 +328,10 @@ class WorkflowStateMachine(Subject):
         Returns:
             True if all tasks are in a final state
         """
-        final_states = {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
-        return all(task.status in final_states for task in self.workflow_execution.tasks)
+        counts = self._status_counts
+        return (
+            counts[_PENDING] + counts[_RUNNING] + counts[_RETRYING]
+        ) == 0
     
     def _can_continue_after_failure(self, failed_task: TaskExecution) -> bool:
         """Check if workflow can continue after task failure.
@@ -189,6 +344,5 @@ class WorkflowStateMachine(Subject):
         """
         # This would be based on the failure strategy from configuration
         # For now, we'll use a simple heuristic
-        return (self.workflow_execution.partial_completion_allowed or 
-                hasattr(failed_task, 'continue_on_failure') and 
-                getattr(failed_task, 'continue_on_failure', False))
+        return (self.workflow_execution.partial_completion_allowed or
+                failed_task.continue_on_failure)
@@ -0,0 +1,11 @@
+"""Shared pytest configuration."""
+
+import asyncio
+
+# Run async tests on uvloop when it is installed, as the CLI does; uvloop
+# is optional and not available on Windows
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
@@ -5,11 +5,12 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 import aiohttp
+import orjson
 
 from src.lead_agent.models import AgentConfig, AgentResponse, AgentType
 from src.lead_agent.agents.base import BaseAgent, AgentFactory
 from src.lead_agent.agents.ai_agent import AIAgent
-from src.lead_agent.agents.mcp_server import MCPServerAgent
+from src.lead_agent.agents.mcp_server import MCPServerAgent, _loads
 from src.lead_agent.agents.http_api import HTTPAPIAgent
 
 
@@ -47,12 +48,12 @@ class TestBaseAgent:
         assert agent.type == AgentType.AI_AGENT
         assert agent.config is config
     
-    def test_successful_execution_with_resilience(self):
+    async def test_successful_execution_with_resilience(self):
         """Test successful execution with resilience patterns."""
         config = AgentConfig(name="test_agent", type=AgentType.AI_AGENT)
         agent = MockAgent(config)
         
-        response = asyncio.run(agent.execute_with_resilience("test_action", {"param": "value"}))
+        response = await agent.execute_with_resilience("test_action", {"param": "value"})
         
         assert response.success is True
         assert response.result == {"action": "test_action", "parameters": {"param": "value"}}
@@ -60,7 +61,7 @@ class TestBaseAgent:
         assert response.execution_time > 0
         assert agent.execution_count == 1
     
-    def test_execution_with_retry(self):
+    async def test_execution_with_retry(self):
         """Test execution with retry on failure."""
         config = AgentConfig(
             name="test_agent", 
@@ -69,7 +70,7 @@ class TestBaseAgent:
         )
         agent = MockAgent(config, should_fail=True)
         
-        response = asyncio.run(agent.execute_with_resilience("test_action", {}))
+        response = await agent.execute_with_resilience("test_action", {})
         
         assert response.success is False
         assert "Mock agent failure" in response.error
@@ -77,29 +78,30 @@ class TestBaseAgent:
         # Should have attempted multiple times due to retry
         assert agent.execution_count == 3
     
-    def test_circuit_breaker_blocks_execution(self):
+    async def test_circuit_breaker_blocks_execution(self):
         """Test that circuit breaker blocks execution after failures."""
         config = AgentConfig(
             name="test_agent",
             type=AgentType.AI_AGENT,
+            retry_config={"initial_delay": 0.1},
             circuit_breaker={"failure_threshold": 2, "recovery_timeout": 60}
         )
         agent = MockAgent(config, should_fail=True)
         
         # First two executions should fail and open circuit breaker
-        response1 = asyncio.run(agent.execute_with_resilience("action1", {}))
-        response2 = asyncio.run(agent.execute_with_resilience("action2", {}))
+        response1 = await agent.execute_with_resilience("action1", {})
+        response2 = await agent.execute_with_resilience("action2", {})
         
         assert response1.success is False
         assert response2.success is False
         
         # Third execution should be blocked by circuit breaker
-        response3 = asyncio.run(agent.execute_with_resilience("action3", {}))
+        response3 = await agent.execute_with_resilience("action3", {})
         
         assert response3.success is False
         assert "Circuit breaker is open" in response3.error
     
-    def test_timeout_handling(self):
+    async def test_timeout_handling(self):
         """Test timeout handling in execution."""
         config = AgentConfig(
             name="test_agent",
@@ -113,11 +115,118 @@ class TestBaseAgent:
                 return AgentResponse(success=True, result="slow_result")
         
         agent = SlowAgent(config)
-        response = asyncio.run(agent.execute_with_resilience("slow_action", {}))
+        response = await agent.execute_with_resilience("slow_action", {})
         
         assert response.success is False
         assert "timeout" in response.error.lower()
 
+    async def test_execute_internal_timeout(self):
+        """Test that the internal execute enforces the agent timeout."""
+        config = AgentConfig(name="test_agent", type=AgentType.AI_AGENT, timeout=1.0)
+        
+        class SlowAgent(MockAgent):
+            async def execute(self, action: str, parameters: dict) -> AgentResponse:
+                await asyncio.sleep(5)
+                return AgentResponse(success=True, result="slow_result")
+        
+        agent = SlowAgent(config)
+        
+        with pytest.raises(Exception) as exc_info:
+            await agent._execute_internal("slow_action", {})
+        
+        assert "Agent execution timeout after 1.0s" in str(exc_info.value)
+    
+    async def test_execute_not_implemented(self):
+        """Test that the base execute must be overridden."""
+        config = AgentConfig(name="test_agent", type=AgentType.AI_AGENT)
+        agent = BaseAgent(config)
+        
+        with pytest.raises(NotImplementedError):
+            await agent.execute("action", {})
+    
+    def test_resilience_shared_per_endpoint(self):
+        """Test that agents on the same endpoint share resilience state."""
+        BaseAgent.reset_shared_state()
+        config = AgentConfig(
+            name="agent_a",
+            type=AgentType.AI_AGENT,
+            endpoint="https://shared.example.com"
+        )
+        other_config = AgentConfig(
+            name="agent_b",
+            type=AgentType.HTTP_API,
+            endpoint="https://shared.example.com"
+        )
+        
+        agent = MockAgent(config)
+        other = MockAgent(other_config)
+        unrelated = MockAgent(AgentConfig(name="agent_c", type=AgentType.AI_AGENT))
+        
+        assert agent.circuit_breaker is other.circuit_breaker
+        assert agent.retry_handler is other.retry_handler
+        assert unrelated.circuit_breaker is not agent.circuit_breaker
+        BaseAgent.reset_shared_state()
+    
+    def test_resilience_state_bounded(self, monkeypatch):
+        """Test that only the most recently used resilience state is kept."""
+        BaseAgent.reset_shared_state()
+        monkeypatch.setattr(BaseAgent, "_shared_state_size", 2)
+        configs = [
+            AgentConfig(name=f"agent_{i}", type=AgentType.AI_AGENT, endpoint=f"https://{i}.example.com")
+            for i in range(3)
+        ]
+        
+        first = MockAgent(configs[0])
+        MockAgent(configs[1])
+        assert MockAgent(configs[0]).circuit_breaker is first.circuit_breaker
+        MockAgent(configs[2])
+        
+        assert [key[0] for key in BaseAgent._circuit_breakers] == [
+            "https://0.example.com", "https://2.example.com"
+        ]
+        assert len(BaseAgent._retry_handlers) == 2
+        BaseAgent.reset_shared_state()
+    
+    async def test_shared_session_reused(self):
+        """Test that agents share one HTTP session per event loop."""
+        first = await BaseAgent._get_session()
+        second = await BaseAgent._get_session()
+        await BaseAgent.close_session()
+
+        assert first is second
+        assert first.closed
+        assert BaseAgent._session is None
+    
+    def test_shared_session_closed_when_replaced(self):
+        """Test that a session from an earlier event loop is closed on replacement."""
+        first = asyncio.run(BaseAgent._get_session())
+        second = asyncio.run(BaseAgent._get_session())
+        
+        assert second is not first
+        assert first.closed
+        assert not second.closed
+        
+        asyncio.run(BaseAgent.close_session())
+        
+        assert second.closed
+    
+    def test_http2_client_closed_when_replaced(self):
+        """Test that an HTTP/2 client from an earlier event loop is closed on replacement."""
+        clients = [Mock(is_closed=False, aclose=AsyncMock()) for _ in range(2)]
+        
+        with patch('httpx.AsyncClient', side_effect=clients):
+            first = asyncio.run(BaseAgent._get_http2_client())
+            second = asyncio.run(BaseAgent._get_http2_client())
+        
+        assert (first, second) == tuple(clients)
+        first.aclose.assert_awaited_once()
+        second.aclose.assert_not_awaited()
+        
+        asyncio.run(BaseAgent.close_session())
+        
+        second.aclose.assert_awaited_once()
+        assert BaseAgent._http2_client is None
+
 
 class TestAgentFactory:
     """Test AgentFactory functionality."""
@@ -134,6 +243,20 @@ class TestAgentFactory:
         assert agent.name == "custom_agent"
         assert agent.type == AgentType.CUSTOM
     
+    def test_create_builtin_agent_types(self):
+        """Test creating the built-in agent types resolves their classes."""
+        expected = {
+            AgentType.AI_AGENT: AIAgent,
+            AgentType.MCP_SERVER: MCPServerAgent,
+            AgentType.HTTP_API: HTTPAPIAgent
+        }
+        
+        for agent_type, agent_class in expected.items():
+            agent = AgentFactory.create_agent(AgentConfig(name="agent", type=agent_type))
+            
+            assert type(agent) is agent_class
+            assert AgentFactory._agent_types[agent_type] is agent_class
+    
     def test_create_unknown_agent_type(self):
         """Test creating unknown agent type raises error."""
         # Create a new enum value for testing
@@ -158,7 +281,7 @@ class TestAIAgent:
     """Test AIAgent implementation."""
     
     @patch('aiohttp.ClientSession.post')
-    def test_successful_execution(self, mock_post):
+    async def test_successful_execution(self, mock_post):
         """Test successful AI agent execution."""
         # Mock HTTP response
         mock_response = AsyncMock()
@@ -173,21 +296,23 @@ class TestAIAgent:
         )
         agent = AIAgent(config)
         
-        response = asyncio.run(agent.execute("generate", {"prompt": "Hello"}))
+        response = await agent.execute("generate", {"prompt": "Hello"})
         
         assert response.success is True
         assert response.result == {"result": "ai_response"}
         assert response.error is None
         assert response.metadata["status_code"] == 200
+        mock_response.json.assert_called_once_with(loads=orjson.loads)
         
         # Verify request was made correctly
         mock_post.assert_called_once()
         call_args = mock_post.call_args
         assert call_args[1]["json"]["action"] == "generate"
         assert call_args[1]["json"]["parameters"] == {"prompt": "Hello"}
+        assert call_args[1]["headers"] == {}
     
     @patch('aiohttp.ClientSession.post')
-    def test_execution_with_authentication(self, mock_post):
+    async def test_execution_with_authentication(self, mock_post):
         """Test AI agent execution with authentication."""
         mock_response = AsyncMock()
         mock_response.status = 200
@@ -205,7 +330,7 @@ class TestAIAgent:
         )
         agent = AIAgent(config)
         
-        response = asyncio.run(agent.execute("generate", {"prompt": "Hello"}))
+        response = await agent.execute("generate", {"prompt": "Hello"})
         
         assert response.success is True
         
@@ -215,7 +340,7 @@ class TestAIAgent:
         assert headers["Authorization"] == "Bearer secret_token"
     
     @patch('aiohttp.ClientSession.post')
-    def test_execution_with_api_key(self, mock_post):
+    async def test_execution_with_api_key(self, mock_post):
         """Test AI agent execution with API key authentication."""
         mock_response = AsyncMock()
         mock_response.status = 200
@@ -234,7 +359,7 @@ class TestAIAgent:
         )
         agent = AIAgent(config)
         
-        response = asyncio.run(agent.execute("generate", {}))
+        response = await agent.execute("generate", {})
         
         assert response.success is True
         
@@ -244,7 +369,7 @@ class TestAIAgent:
         assert headers["X-API-Key"] == "api_key_123"
     
     @patch('aiohttp.ClientSession.post')
-    def test_http_error_handling(self, mock_post):
+    async def test_http_error_handling(self, mock_post):
         """Test AI agent HTTP error handling."""
         mock_response = AsyncMock()
         mock_response.status = 400
@@ -254,21 +379,21 @@ class TestAIAgent:
         config = AgentConfig(name="ai_agent", type=AgentType.AI_AGENT, endpoint="https://api.example.com")
         agent = AIAgent(config)
         
-        response = asyncio.run(agent.execute("generate", {}))
+        response = await agent.execute("generate", {})
         
         assert response.success is False
         assert "HTTP 400: Bad Request" in response.error
         assert response.metadata["status_code"] == 400
     
     @patch('aiohttp.ClientSession.post')
-    def test_timeout_handling(self, mock_post):
+    async def test_timeout_handling(self, mock_post):
         """Test AI agent timeout handling."""
-        mock_post.side_effect = aiohttp.ClientTimeout()
+        mock_post.side_effect = asyncio.TimeoutError()
         
         config = AgentConfig(name="ai_agent", type=AgentType.AI_AGENT, endpoint="https://api.example.com")
         agent = AIAgent(config)
         
-        response = asyncio.run(agent.execute("generate", {}))
+        response = await agent.execute("generate", {})
         
         assert response.success is False
         assert "Request timeout" in response.error
@@ -278,10 +403,11 @@ class TestMCPServerAgent:
     """Test MCPServerAgent implementation."""
     
     @patch('aiohttp.ClientSession.post')
-    def test_successful_execution(self, mock_post):
+    async def test_successful_execution(self, mock_post):
         """Test successful MCP server execution."""
         mock_response = AsyncMock()
         mock_response.status = 200
+        mock_response.content_length = None
         mock_response.json = AsyncMock(return_value={
             "jsonrpc": "2.0",
             "id": 1,
@@ -296,25 +422,27 @@ class TestMCPServerAgent:
         )
         agent = MCPServerAgent(config)
         
-        response = asyncio.run(agent.execute("tool_name", {"param": "value"}))
+        response = await agent.execute("tool_name", {"param": "value"})
         
         assert response.success is True
         assert response.result == {"data": "mcp_result"}
         assert response.metadata["jsonrpc_id"] == 1
+        mock_response.json.assert_called_once_with(loads=_loads)
         
         # Verify JSON-RPC format
         call_args = mock_post.call_args
-        payload = call_args[1]["json"]
+        payload = orjson.loads(call_args[1]["data"])
         assert payload["jsonrpc"] == "2.0"
         assert payload["method"] == "tools/call"
         assert payload["params"]["name"] == "tool_name"
         assert payload["params"]["arguments"] == {"param": "value"}
     
     @patch('aiohttp.ClientSession.post')
-    def test_mcp_error_handling(self, mock_post):
+    async def test_mcp_error_handling(self, mock_post):
         """Test MCP server error handling."""
         mock_response = AsyncMock()
         mock_response.status = 200
+        mock_response.content_length = None
         mock_response.json = AsyncMock(return_value={
             "jsonrpc": "2.0",
             "id": 1,
@@ -328,22 +456,168 @@ class TestMCPServerAgent:
         config = AgentConfig(name="mcp_agent", type=AgentType.MCP_SERVER, endpoint="http://localhost:8080")
         agent = MCPServerAgent(config)
         
-        response = asyncio.run(agent.execute("unknown_tool", {}))
+        response = await agent.execute("unknown_tool", {})
         
         assert response.success is False
         assert "MCP Error -32601: Method not found" in response.error
         assert response.metadata["error_code"] == -32601
+    
+    @patch('aiohttp.ClientSession.post')
+    async def test_shared_session_and_auth_headers(self, mock_post):
+        """Test that MCP calls reuse the shared session and auth headers."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.content_length = None
+        mock_response.json = AsyncMock(return_value={"jsonrpc": "2.0", "id": 1, "result": {}})
+        mock_post.return_value.__aenter__.return_value = mock_response
+        
+        config = AgentConfig(
+            name="mcp_agent",
+            type=AgentType.MCP_SERVER,
+            endpoint="http://localhost:8080",
+            authentication={"type": "bearer", "token": "secret"}
+        )
+        agent = MCPServerAgent(config)
+        
+        await agent.execute("tool", {})
+        first = await agent._get_session()
+        await agent.execute("tool", {})
+        second = await agent._get_session()
+        await BaseAgent.close_session()
+        
+        assert first is second
+        assert mock_post.call_count == 2
+        assert mock_post.call_args[1]["headers"] == {
+            "Content-Type": "application/json",
+            "Authorization": "Bearer secret"
+        }
+    
+    def test_loads_large_payload(self):
+        """Test JSON decoding for payloads above the simdjson threshold."""
+        payload = {"result": {"items": ["x" * 100] * 1000}, "id": 1}
+        data = orjson.dumps(payload)
+        
+        assert len(data) > 64 * 1024
+        assert _loads(data) == payload
+        assert _loads(data.decode()) == payload
+        
+        with pytest.raises(ValueError):
+            _loads(b"[" * (70 * 1024))
+    
+    @patch('aiohttp.ClientSession.post')
+    async def test_streams_large_response(self, mock_post):
+        """Test that large MCP responses are parsed while they are read."""
+        pytest.importorskip("ijson")
+        
+        body = orjson.dumps({"jsonrpc": "2.0", "id": 1, "result": {"items": ["x" * 100] * 20000}})
+        
+        class ChunkedStream:
+            def __init__(self, data):
+                self.data = data
+                self.reads = 0
+            
+            async def read(self, n=-1):
+                self.reads += 1
+                chunk, self.data = self.data[:n], self.data[n:]
+                return chunk
+        
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.content_length = len(body)
+        mock_response.content = ChunkedStream(body)
+        mock_post.return_value.__aenter__.return_value = mock_response
+        
+        config = AgentConfig(
+            name="mcp_agent",
+            type=AgentType.MCP_SERVER,
+            endpoint="http://localhost:8080/mcp"
+        )
+        agent = MCPServerAgent(config)
+        
+        response = await agent.execute("tool_name", {})
+        
+        assert response.success is True
+        assert response.result == {"items": ["x" * 100] * 20000}
+        assert mock_response.content.reads > 1
+        mock_response.json.assert_not_called()
+    
+    async def test_http2_execution(self):
+        """Test that MCP calls use the shared HTTP/2 client when enabled."""
+        pytest.importorskip("httpx")
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"jsonrpc": "2.0", "id": 1, "result": {"data": "h2"}}'
+        mock_client = Mock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        
+        config = AgentConfig(
+            name="mcp_agent",
+            type=AgentType.MCP_SERVER,
+            endpoint="http://localhost:8080",
+            custom_params={"http2": True}
+        )
+        agent = MCPServerAgent(config)
+        
+        with patch('src.lead_agent.agents.mcp_server.HTTP2_AVAILABLE', True), \
+             patch.object(BaseAgent, '_get_http2_client', AsyncMock(return_value=mock_client)):
+            response = await agent.execute("tool", {"param": "value"})
+        
+        assert response.success is True
+        assert response.result == {"data": "h2"}
+        payload = orjson.loads(mock_client.post.call_args[1]["content"])
+        assert payload["params"]["name"] == "tool"
+    
+    async def test_execute_many_bounds_concurrency(self):
+        """Test that batched HTTP/2 calls run concurrently up to the endpoint limit."""
+        pytest.importorskip("httpx")
+        
+        in_flight = 0
+        peak = 0
+        
+        async def post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = Mock()
+            response.status_code = 200
+            response.content = kwargs["content"].replace(b'"method":"tools/call","params"', b'"result"')
+            return response
+        
+        mock_client = Mock()
+        mock_client.post = post
+        
+        config = AgentConfig(
+            name="mcp_agent",
+            type=AgentType.MCP_SERVER,
+            endpoint="http://localhost:8080",
+            custom_params={"http2": True, "max_concurrency": 3}
+        )
+        # Two agents on one endpoint share the limit
+        agents = [MCPServerAgent(config), MCPServerAgent(config)]
+        calls = [("tool", {"n": i}) for i in range(10)]
+        
+        with patch('src.lead_agent.agents.mcp_server.HTTP2_AVAILABLE', True), \
+             patch.object(BaseAgent, '_get_http2_client', AsyncMock(return_value=mock_client)):
+            responses = await asyncio.gather(*(agent.execute_many(calls) for agent in agents))
+        
+        for batch in responses:
+            assert [r.result["arguments"]["n"] for r in batch] == list(range(10))
+        assert peak == 3
 
 
 class TestHTTPAPIAgent:
     """Test HTTPAPIAgent implementation."""
     
     @patch('aiohttp.ClientSession.request')
-    def test_successful_get_request(self, mock_request):
+    async def test_successful_get_request(self, mock_request):
         """Test successful GET request."""
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={"data": "get_result"})
+        mock_response.read = AsyncMock(return_value=orjson.dumps({"data": "get_result"}))
+        mock_response.content_type = "application/json"
         mock_response.url = "https://api.example.com/endpoint"
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -355,10 +629,10 @@ class TestHTTPAPIAgent:
         )
         agent = HTTPAPIAgent(config)
         
-        response = asyncio.run(agent.execute("endpoint", {
+        response = await agent.execute("endpoint", {
             "method": "GET",
             "params": {"limit": 10}
-        }))
+        })
         
         assert response.success is True
         assert response.result == {"data": "get_result"}
@@ -372,11 +646,12 @@ class TestHTTPAPIAgent:
         assert call_args[1]["params"] == {"limit": 10}
     
     @patch('aiohttp.ClientSession.request')
-    def test_successful_post_request(self, mock_request):
+    async def test_successful_post_request(self, mock_request):
         """Test successful POST request."""
         mock_response = AsyncMock()
         mock_response.status = 201
-        mock_response.json = AsyncMock(return_value={"id": 123, "status": "created"})
+        mock_response.read = AsyncMock(return_value=orjson.dumps({"id": 123, "status": "created"}))
+        mock_response.content_type = "application/json"
         mock_response.url = "https://api.example.com/create"
         mock_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -388,10 +663,10 @@ class TestHTTPAPIAgent:
         )
         agent = HTTPAPIAgent(config)
         
-        response = asyncio.run(agent.execute("create", {
+        response = await agent.execute("create", {
             "method": "POST",
             "data": {"name": "test", "value": 42}
-        }))
+        })
         
         assert response.success is True
         assert response.result == {"id": 123, "status": "created"}
@@ -402,11 +677,12 @@ class TestHTTPAPIAgent:
         assert call_args[1]["json"] == {"name": "test", "value": 42}
     
     @patch('aiohttp.ClientSession.request')
-    def test_basic_authentication(self, mock_request):
+    async def test_basic_authentication(self, mock_request):
         """Test HTTP agent with basic authentication."""
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={"authenticated": True})
+        mock_response.read = AsyncMock(return_value=orjson.dumps({"authenticated": True}))
+        mock_response.content_type = "application/json"
         mock_response.url = "https://api.example.com/secure"
         mock_response.headers = {}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -423,7 +699,7 @@ class TestHTTPAPIAgent:
         )
         agent = HTTPAPIAgent(config)
         
-        response = asyncio.run(agent.execute("secure", {"method": "GET"}))
+        response = await agent.execute("secure", {"method": "GET"})
         
         assert response.success is True
         
@@ -434,12 +710,13 @@ class TestHTTPAPIAgent:
         assert auth.password == "pass"
     
     @patch('aiohttp.ClientSession.request')
-    def test_text_response_handling(self, mock_request):
+    async def test_text_response_handling(self, mock_request):
         """Test handling of non-JSON text responses."""
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(side_effect=aiohttp.ContentTypeError(None, None))
-        mock_response.text = AsyncMock(return_value="plain text response")
+        mock_response.read = AsyncMock(return_value=b"plain text response")
+        mock_response.content_type = "text/plain"
+        mock_response.get_encoding = Mock(return_value="utf-8")
         mock_response.url = "https://api.example.com/text"
         mock_response.headers = {"Content-Type": "text/plain"}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -447,18 +724,19 @@ class TestHTTPAPIAgent:
         config = AgentConfig(name="http_agent", type=AgentType.HTTP_API, endpoint="https://api.example.com")
         agent = HTTPAPIAgent(config)
         
-        response = asyncio.run(agent.execute("text", {"method": "GET"}))
+        response = await agent.execute("text", {"method": "GET"})
         
         assert response.success is True
         assert response.result == "plain text response"
     
     @patch('aiohttp.ClientSession.request')
-    def test_error_response_handling(self, mock_request):
+    async def test_error_response_handling(self, mock_request):
         """Test handling of HTTP error responses."""
         mock_response = AsyncMock()
         mock_response.status = 404
-        mock_response.json = AsyncMock(side_effect=aiohttp.ContentTypeError(None, None))
-        mock_response.text = AsyncMock(return_value="Not Found")
+        mock_response.read = AsyncMock(return_value=b"Not Found")
+        mock_response.content_type = "text/plain"
+        mock_response.get_encoding = Mock(return_value="utf-8")
         mock_response.url = "https://api.example.com/missing"
         mock_response.headers = {}
         mock_request.return_value.__aenter__.return_value = mock_response
@@ -466,8 +744,117 @@ class TestHTTPAPIAgent:
         config = AgentConfig(name="http_agent", type=AgentType.HTTP_API, endpoint="https://api.example.com")
         agent = HTTPAPIAgent(config)
         
-        response = asyncio.run(agent.execute("missing", {"method": "GET"}))
+        response = await agent.execute("missing", {"method": "GET"})
         
         assert response.success is False
         assert "HTTP 404: Not Found" in response.error
         assert response.metadata["status_code"] == 404
+    
+    @patch('aiohttp.ClientSession.request')
+    async def test_api_key_with_custom_headers(self, mock_request):
+        """Test HTTP agent merges custom headers with precomputed auth headers."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.read = AsyncMock(return_value=orjson.dumps({"ok": True}))
+        mock_response.content_type = "application/json"
+        mock_response.url = "https://api.example.com/secure"
+        mock_response.headers = {}
+        mock_request.return_value.__aenter__.return_value = mock_response
+        
+        config = AgentConfig(
+            name="http_agent",
+            type=AgentType.HTTP_API,
+            endpoint="https://api.example.com",
+            authentication={
+                "type": "api_key",
+                "key": "api_key_123",
+                "header": "X-API-Key"
+            }
+        )
+        agent = HTTPAPIAgent(config)
+        
+        response = await agent.execute("secure", {
+            "method": "GET",
+            "headers": {"X-Request-Id": "abc"}
+        })
+        
+        assert response.success is True
+        
+        call_args = mock_request.call_args
+        headers = call_args[1]["headers"]
+        assert headers["X-API-Key"] == "api_key_123"
+        assert headers["X-Request-Id"] == "abc"
+        assert call_args[1]["auth"] is None
+        assert "X-Request-Id" not in agent._base_headers
+    
+    @patch('aiohttp.ClientSession.request')
+    async def test_custom_headers_do_not_override_auth(self, mock_request):
+        """Test that configured authentication wins over per-call headers."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.read = AsyncMock(return_value=orjson.dumps({"ok": True}))
+        mock_response.content_type = "application/json"
+        mock_response.url = "https://api.example.com/secure"
+        mock_response.headers = {}
+        mock_request.return_value.__aenter__.return_value = mock_response
+        
+        config = AgentConfig(
+            name="http_agent",
+            type=AgentType.HTTP_API,
+            endpoint="https://api.example.com",
+            authentication={"type": "bearer", "token": "secret_token"}
+        )
+        agent = HTTPAPIAgent(config)
+        
+        await agent.execute("secure", {
+            "method": "GET",
+            "headers": {"Authorization": "Bearer caller_token", "X-Request-Id": "abc"}
+        })
+        
+        headers = mock_request.call_args[1]["headers"]
+        assert headers == {"Authorization": "Bearer secret_token", "X-Request-Id": "abc"}
+    
+    @patch('aiohttp.ClientSession.request')
+    async def test_no_content_response_skips_body(self, mock_request):
+        """Test that 204 responses are not read or decoded."""
+        mock_response = AsyncMock()
+        mock_response.status = 204
+        mock_response.url = "https://api.example.com/item"
+        mock_response.headers = {}
+        mock_request.return_value.__aenter__.return_value = mock_response
+        
+        config = AgentConfig(name="http_agent", type=AgentType.HTTP_API, endpoint="https://api.example.com")
+        agent = HTTPAPIAgent(config)
+        
+        response = await agent.execute("item", {"method": "DELETE"})
+        
+        assert response.success is True
+        assert response.result is None
+        mock_response.read.assert_not_called()
+    
+    @pytest.mark.parametrize("base,endpoint,expected", [
+        ("https://api.example.com/v1/", "users", "https://api.example.com/v1/users"),
+        ("https://api.example.com/v1/", "users/1", "https://api.example.com/v1/users/1"),
+        ("https://api.example.com/v1/", "/users", "https://api.example.com/users"),
+        ("https://api.example.com/v1/", "../v2/users", "https://api.example.com/v2/users"),
+        ("https://api.example.com/v1/", "users?page=2", "https://api.example.com/v1/users?page=2"),
+        ("https://api.example.com/v1/", "https://other.example.com/x", "https://other.example.com/x"),
+        ("https://api.example.com/v1/", "//other.example.com/x", "https://other.example.com/x"),
+        ("https://api.example.com/v1", "users", "https://api.example.com/users"),
+        ("https://api.example.com", "users", "https://api.example.com/users"),
+    ])
+    @patch('aiohttp.ClientSession.request')
+    async def test_url_building(self, mock_request, base, endpoint, expected):
+        """Test that URLs resolve against the configured endpoint like urljoin."""
+        mock_response = AsyncMock()
+        mock_response.status = 204
+        mock_response.url = expected
+        mock_response.headers = {}
+        mock_request.return_value.__aenter__.return_value = mock_response
+        
+        config = AgentConfig(name="http_agent", type=AgentType.HTTP_API, endpoint=base)
+        agent = HTTPAPIAgent(config)
+        
+        await agent.execute(endpoint, {"method": "GET"})
+        
+        assert mock_request.call_args[1]["url"] == expected
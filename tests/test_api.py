@@ -0,0 +1,208 @@
+"""Tests for the REST API routes."""
+
+import time
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.lead_agent.api import routes
+from src.lead_agent.models import WorkflowConfig, WorkflowResult, WorkflowStatus
+
+
+WORKFLOW_REQUEST = {
+    "name": "api_workflow",
+    "agents": [{"name": "test_agent", "type": "ai_agent"}],
+    "tasks": [{"name": "task1", "agent_name": "test_agent", "action": "action1"}]
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_store():
+    """Start every test with an empty execution store."""
+    def clear():
+        for shard in routes._execution_shards:
+            shard.clear()
+        for shard in routes._result_shards:
+            shard.clear()
+        routes.status_index.clear()
+    
+    clear()
+    yield
+    clear()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client whose background runner leaves executions queued."""
+    async def no_op(execution_id, workflow_request):
+        pass
+    
+    monkeypatch.setattr(routes, "execute_workflow_background", no_op)
+    
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api/v1")
+    return TestClient(app)
+
+
+def _store(index: int, status: str, created_ns: int = None) -> UUID:
+    """Store an execution record in shard 0 and return its ID."""
+    execution_id = UUID(int=index * routes._SHARDS)
+    routes._bucket(execution_id)[execution_id] = routes._ExecutionRecord(
+        execution_id=execution_id,
+        name=f"workflow{index}",
+        status=status,
+        created_ns=time.time_ns() if created_ns is None else created_ns
+    )
+    routes.status_index[status].add(execution_id)
+    return execution_id
+
+
+class TestWorkflowRoutes:
+    """Test workflow endpoints."""
+    
+    def test_create_and_get_workflow(self, client):
+        """Test that a created workflow can be fetched by ID."""
+        response = client.post("/api/v1/workflows", json=WORKFLOW_REQUEST)
+        
+        assert response.status_code == 200
+        created = response.json()
+        assert created["status"] == "queued"
+        assert created["total_tasks"] == 1
+        
+        response = client.get(f"/api/v1/workflows/{created['execution_id']}")
+        
+        assert response.status_code == 200
+        assert response.json()["name"] == "api_workflow"
+    
+    @pytest.mark.parametrize("body,detail", [
+        (b"{", [{
+            "type": "json_invalid",
+            "loc": ["body", 1],
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": "Expecting property name enclosed in double quotes"}
+        }]),
+        (b"", [{"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}]),
+        (b'{"name": "api_workflow", "agents": []}', [{
+            "type": "missing",
+            "loc": ["body", "tasks"],
+            "msg": "Field required",
+            "input": {"name": "api_workflow", "agents": []}
+        }]),
+    ], ids=["invalid_json", "empty", "missing_field"])
+    def test_create_workflow_validation_errors(self, client, body, detail):
+        """Test that invalid bodies report the errors FastAPI reports for declared bodies."""
+        response = client.post(
+            "/api/v1/workflows", content=body, headers={"Content-Type": "application/json"}
+        )
+        
+        assert response.status_code == 422
+        assert response.json() == {"detail": detail}
+    
+    def test_get_unknown_workflow(self, client):
+        """Test that unknown execution IDs return 404."""
+        response = client.get(f"/api/v1/workflows/{UUID(int=1)}")
+        
+        assert response.status_code == 404
+    
+    def test_list_workflows_status_filter(self, client):
+        """Test listing workflows newest first, filtered by status."""
+        ids = [
+            client.post("/api/v1/workflows", json=WORKFLOW_REQUEST).json()["execution_id"]
+            for _ in range(3)
+        ]
+        routes._set_status(UUID(ids[0]), "completed")
+        routes._set_status(UUID(ids[2]), "completed")
+        
+        response = client.get("/api/v1/workflows", params={"status": "completed"})
+        
+        listing = response.json()
+        assert listing["total"] == 2
+        assert [w["execution_id"] for w in listing["workflows"]] == [ids[2], ids[0]]
+        
+        response = client.get("/api/v1/workflows", params={"page_size": 2, "page": 2})
+        
+        listing = response.json()
+        assert listing["total"] == 3
+        assert [w["execution_id"] for w in listing["workflows"]] == [ids[0]]
+    
+    def test_cancel_workflow(self, client):
+        """Test cancelling a queued workflow."""
+        execution_id = client.post("/api/v1/workflows", json=WORKFLOW_REQUEST).json()["execution_id"]
+        
+        response = client.delete(f"/api/v1/workflows/{execution_id}")
+        
+        assert response.status_code == 200
+        assert routes.status_index["cancelled"] == {UUID(execution_id)}
+    
+    @pytest.mark.parametrize("status", ["completed", "failed", "partially_completed", "cancelled"])
+    def test_cancel_finished_workflow(self, client, status):
+        """Test that finished workflows cannot be cancelled."""
+        execution_id = _store(1, status)
+        
+        response = client.delete(f"/api/v1/workflows/{execution_id}")
+        
+        assert response.status_code == 400
+        assert routes._get_execution(execution_id).status == status
+
+
+class TestExecutionStore:
+    """Test eviction from the execution store."""
+    
+    def test_evicts_oldest_finished_over_capacity(self, monkeypatch):
+        """Test that running executions are skipped, not evicted."""
+        monkeypatch.setattr(routes, "MAX_STORED_EXECUTIONS", 2 * routes._SHARDS)
+        running = _store(1, "running")
+        oldest = _store(2, "completed")
+        cancelled = _store(3, "cancelled")
+        newest = _store(4, "failed")
+        
+        routes._evict_executions(newest)
+        
+        assert list(routes._bucket(newest)) == [running, newest]
+        assert routes.status_index["completed"] == set()
+        assert routes.status_index["cancelled"] == set()
+        assert oldest not in routes._bucket(oldest)
+        assert cancelled not in routes._bucket(cancelled)
+    
+    def test_evicts_expired_finished(self):
+        """Test that finished executions past the TTL are evicted."""
+        expired_ns = time.time_ns() - routes._EXECUTION_TTL_NS - 1
+        expired_running = _store(1, "running", expired_ns)
+        expired = _store(2, "completed", expired_ns)
+        fresh = _store(3, "completed")
+        
+        routes._evict_executions(fresh)
+        
+        assert list(routes._bucket(fresh)) == [expired_running, fresh]
+        assert expired not in routes.status_index["completed"]
+    
+    async def test_background_runner_keeps_cancelled_status(self, monkeypatch):
+        """Test that a run finishing after cancellation stays cancelled."""
+        execution_id = _store(1, "queued")
+        configs = []
+        
+        async def execute_workflow(self, config):
+            configs.append(config)
+            routes._set_status(execution_id, "cancelled")
+            return WorkflowResult(
+                workflow_id="workflow",
+                status=WorkflowStatus.COMPLETED,
+                completed_tasks=1,
+                failed_tasks=0,
+                total_tasks=1,
+                execution_time=0.0
+            )
+        
+        monkeypatch.setattr(routes.LeadAgent, "execute_workflow", execute_workflow)
+        
+        await routes.execute_workflow_background(
+            execution_id, routes.WorkflowRequest.model_validate(WORKFLOW_REQUEST)
+        )
+        
+        assert isinstance(configs[0], WorkflowConfig)
+        assert configs[0].tasks[0].agent_name == "test_agent"
+        assert routes._get_execution(execution_id).status == "cancelled"
+        assert execution_id not in routes._result_bucket(execution_id)
@@ -1,15 +1,22 @@
 """Tests for configuration loader."""
 
-import json
-import tempfile
-from pathlib import Path
+import os
+from datetime import date
+from unittest.mock import patch
 
+import orjson
 import pytest
 import yaml
 
 from src.lead_agent.config_loader import ConfigLoader, ConfigurationError
 from src.lead_agent.models import AgentType, WorkflowConfig, AgentConfig, TaskConfig
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 class TestConfigLoader:
     """Test ConfigLoader class."""
@@ -58,8 +65,47 @@ class TestConfigLoader:
             ConfigLoader.load_from_dict(config_data)
         
         assert "Configuration validation failed" in str(exc_info.value)
+
+    def test_load_from_dict_cached(self):
+        """Test that identical configurations are validated once."""
+        config_data = {
+            "name": "cached_workflow",
+            "agents": [{"name": "test_agent", "type": "ai_agent"}],
+            "tasks": [{"name": "test_task", "agent_name": "test_agent", "action": "test_action"}]
+        }
+
+        first = ConfigLoader.load_from_dict(config_data)
+        second = ConfigLoader.load_from_dict(dict(reversed(list(config_data.items()))))
+
+        assert first is second
+
+        config_data["name"] = "other_workflow"
+        third = ConfigLoader.load_from_dict(config_data)
+
+        assert third is not first
+        assert third.name == "other_workflow"
     
-    def test_load_from_yaml_file(self):
+    def test_load_from_dict_unencodable_values_not_cached(self):
+        """Test that values JSON cannot encode do not share a cached config."""
+        def config_data(day):
+            return {
+                "name": "dated_workflow",
+                "agents": [{"name": "test_agent", "type": "ai_agent"}],
+                "tasks": [{
+                    "name": "test_task",
+                    "agent_name": "test_agent",
+                    "action": "test_action",
+                    "parameters": {"day": day}
+                }]
+            }
+        
+        as_string = ConfigLoader.load_from_dict(config_data("2024-01-01"))
+        as_date = ConfigLoader.load_from_dict(config_data(date(2024, 1, 1)))
+        
+        assert as_date is not as_string
+        assert as_date.tasks[0].parameters["day"] == date(2024, 1, 1)
+
+    def test_load_from_yaml_file(self, tmp_path):
         """Test loading configuration from YAML file."""
         config_data = {
             "name": "test_workflow",
@@ -80,21 +126,17 @@ class TestConfigLoader:
             ]
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = f.name
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text(yaml.dump(config_data, Dumper=_YamlDumper))
         
-        try:
-            config = ConfigLoader.load_from_file(temp_path)
-            
-            assert isinstance(config, WorkflowConfig)
-            assert config.name == "test_workflow"
-            assert len(config.agents) == 1
-            assert len(config.tasks) == 1
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        config = ConfigLoader.load_from_file(temp_path)
+        
+        assert isinstance(config, WorkflowConfig)
+        assert config.name == "test_workflow"
+        assert len(config.agents) == 1
+        assert len(config.tasks) == 1
     
-    def test_load_from_json_file(self):
+    def test_load_from_json_file(self, tmp_path):
         """Test loading configuration from JSON file."""
         config_data = {
             "name": "test_workflow",
@@ -115,19 +157,43 @@ class TestConfigLoader:
             ]
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            temp_path = f.name
+        temp_path = tmp_path / "config.json"
+        temp_path.write_bytes(orjson.dumps(config_data))
         
-        try:
-            config = ConfigLoader.load_from_file(temp_path)
+        config = ConfigLoader.load_from_file(temp_path)
+        
+        assert isinstance(config, WorkflowConfig)
+        assert config.name == "test_workflow"
+        assert len(config.agents) == 1
+        assert len(config.tasks) == 1
+    
+    def test_load_from_file_cached_until_modified(self, tmp_path):
+        """Test that unchanged files are served from the file cache."""
+        config_data = {
+            "name": "file_cached_workflow",
+            "agents": [{"name": "test_agent", "type": "ai_agent"}],
+            "tasks": [{"name": "test_task", "agent_name": "test_agent", "action": "test_action"}]
+        }
+        
+        temp_path = tmp_path / "config.json"
+        temp_path.write_bytes(orjson.dumps(config_data))
+        
+        with patch.object(ConfigLoader, 'load_from_dict', wraps=ConfigLoader.load_from_dict) as load:
+            first = ConfigLoader.load_from_file(temp_path)
+            second = ConfigLoader.load_from_file(temp_path)
+            
+            assert first is second
+            assert load.call_count == 1
             
-            assert isinstance(config, WorkflowConfig)
-            assert config.name == "test_workflow"
-            assert len(config.agents) == 1
-            assert len(config.tasks) == 1
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+            config_data["name"] = "modified_workflow"
+            temp_path.write_bytes(orjson.dumps(config_data))
+            stat = os.stat(temp_path)
+            os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            
+            third = ConfigLoader.load_from_file(temp_path)
+            
+            assert third.name == "modified_workflow"
+            assert load.call_count == 2
     
     def test_load_from_nonexistent_file(self):
         """Test loading from non-existent file."""
@@ -136,47 +202,35 @@ class TestConfigLoader:
         
         assert "Configuration file not found" in str(exc_info.value)
     
-    def test_load_from_unsupported_format(self):
+    def test_load_from_unsupported_format(self, tmp_path):
         """Test loading from unsupported file format."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("some text")
-            temp_path = f.name
+        temp_path = tmp_path / "config.txt"
+        temp_path.write_text("some text")
         
-        try:
-            with pytest.raises(ConfigurationError) as exc_info:
-                ConfigLoader.load_from_file(temp_path)
-            
-            assert "Unsupported file format" in str(exc_info.value)
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        with pytest.raises(ConfigurationError) as exc_info:
+            ConfigLoader.load_from_file(temp_path)
+        
+        assert "Unsupported file format" in str(exc_info.value)
     
-    def test_load_from_invalid_yaml(self):
+    def test_load_from_invalid_yaml(self, tmp_path):
         """Test loading from invalid YAML file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("invalid: yaml: content: [")
-            temp_path = f.name
+        temp_path = tmp_path / "config.yaml"
+        temp_path.write_text("invalid: yaml: content: [")
         
-        try:
-            with pytest.raises(ConfigurationError) as exc_info:
-                ConfigLoader.load_from_file(temp_path)
-            
-            assert "Failed to parse configuration file" in str(exc_info.value)
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        with pytest.raises(ConfigurationError) as exc_info:
+            ConfigLoader.load_from_file(temp_path)
+        
+        assert "Failed to parse configuration file" in str(exc_info.value)
     
-    def test_load_from_invalid_json(self):
+    def test_load_from_invalid_json(self, tmp_path):
         """Test loading from invalid JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write('{"invalid": json content}')
-            temp_path = f.name
+        temp_path = tmp_path / "config.json"
+        temp_path.write_text('{"invalid": json content}')
         
-        try:
-            with pytest.raises(ConfigurationError) as exc_info:
-                ConfigLoader.load_from_file(temp_path)
-            
-            assert "Failed to parse configuration file" in str(exc_info.value)
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        with pytest.raises(ConfigurationError) as exc_info:
+            ConfigLoader.load_from_file(temp_path)
+        
+        assert "Failed to parse configuration file" in str(exc_info.value)
     
     def test_validate_configuration_valid(self):
         """Test validation of valid configuration."""
@@ -229,6 +283,26 @@ class TestConfigLoader:
         
         assert "depends on undefined task" in str(exc_info.value)
     
+    def test_validate_configuration_reports_all_errors(self):
+        """Test that all undefined references are reported together."""
+        config = WorkflowConfig(
+            name="test_workflow",
+            agents=[
+                AgentConfig(name="agent1", type=AgentType.AI_AGENT)
+            ],
+            tasks=[
+                TaskConfig(name="task1", agent_name="missing_agent", action="action1"),
+                TaskConfig(name="task2", agent_name="agent1", action="action2", depends_on=["missing_task"])
+            ]
+        )
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            ConfigLoader.validate_configuration(config)
+        
+        message = str(exc_info.value)
+        assert "Task 'task1' references undefined agent 'missing_agent'" in message
+        assert "Task 'task2' depends on undefined task 'missing_task'" in message
+    
     def test_validate_configuration_circular_dependency(self):
         """Test validation with circular dependencies."""
         config = WorkflowConfig(
@@ -270,5 +344,20 @@ class TestConfigLoader:
             TaskConfig(name="D", agent_name="agent1", action="action", depends_on=["B", "C"])
         ]
         
-        # Should not raise any exception
-        ConfigLoader._check_circular_dependencies(tasks)
+        order = ConfigLoader._check_circular_dependencies(tasks)
+        
+        assert sorted(order) == ["A", "B", "C", "D"]
+        assert order[0] == "A"
+        assert order[-1] == "D"
+    
+    def test_check_circular_dependencies_deep_chain(self):
+        """Test that long dependency chains do not hit the recursion limit."""
+        tasks = [TaskConfig(name="task0", agent_name="agent1", action="action")]
+        tasks += [
+            TaskConfig(name=f"task{i}", agent_name="agent1", action="action", depends_on=[f"task{i - 1}"])
+            for i in range(1, 5000)
+        ]
+        
+        order = ConfigLoader._check_circular_dependencies(tasks)
+        
+        assert order == [f"task{i}" for i in range(5000)]
@@ -1,18 +1,22 @@
 """Integration tests for the Lead Agent system."""
 
-import asyncio
-import json
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import orjson
 import pytest
 import yaml
 
+from src.lead_agent.config_loader import ConfigLoader
 from src.lead_agent.lead_agent import LeadAgent
 from src.lead_agent.workflow.engine import WorkflowEngine
 from src.lead_agent.models import WorkflowStatus, AgentResponse
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 class TestLeadAgentIntegration:
     """Integration tests for LeadAgent."""
@@ -85,12 +89,13 @@ class TestLeadAgentIntegration:
     
     @patch('aiohttp.ClientSession.request')
     @patch('aiohttp.ClientSession.post')
-    def test_successful_workflow_execution(self, mock_post, mock_request):
+    async def test_successful_workflow_execution(self, mock_post, mock_request, tmp_path):
         """Test successful end-to-end workflow execution."""
         # Mock HTTP responses
         http_response = AsyncMock()
         http_response.status = 200
-        http_response.json = AsyncMock(return_value={"data": ["item1", "item2", "item3"]})
+        http_response.read = AsyncMock(return_value=orjson.dumps({"data": ["item1", "item2", "item3"]}))
+        http_response.content_type = "application/json"
         http_response.url = "https://api.example.com/api/data"
         http_response.headers = {"Content-Type": "application/json"}
         mock_request.return_value.__aenter__.return_value = http_response
@@ -103,45 +108,42 @@ class TestLeadAgentIntegration:
         # Create workflow configuration file
         config_data = self.create_test_workflow_config()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(config_data, Dumper=_YamlDumper))
         
-        try:
-            # Execute workflow
-            lead_agent = LeadAgent()
-            result = asyncio.run(lead_agent.execute_workflow_from_file(config_path))
-            
-            # Verify results
-            assert result.status == WorkflowStatus.COMPLETED
-            assert result.completed_tasks == 2
-            assert result.failed_tasks == 0
-            assert result.total_tasks == 2
-            assert result.execution_time > 0
-            
-            # Verify task results
-            assert "fetch_data" in result.results
-            assert "process_data" in result.results
-            assert result.results["fetch_data"] == {"data": ["item1", "item2", "item3"]}
-            assert result.results["process_data"] == {"analysis": "Data contains 3 items"}
-            
-            # Verify no errors
-            assert len(result.errors) == 0
-            
-            # Verify agents were called correctly
-            assert mock_request.call_count == 1
-            assert mock_post.call_count == 1
-            
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        # Execute workflow
+        lead_agent = LeadAgent()
+        result = await lead_agent.execute_workflow_from_file(config_path)
+        
+        # Verify results
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.completed_tasks == 2
+        assert result.failed_tasks == 0
+        assert result.total_tasks == 2
+        assert result.execution_time > 0
+        
+        # Verify task results
+        assert "fetch_data" in result.results
+        assert "process_data" in result.results
+        assert result.results["fetch_data"] == {"data": ["item1", "item2", "item3"]}
+        assert result.results["process_data"] == {"analysis": "Data contains 3 items"}
+        
+        # Verify no errors
+        assert len(result.errors) == 0
+        
+        # Verify agents were called correctly
+        assert mock_request.call_count == 1
+        assert mock_post.call_count == 1
     
     @patch('aiohttp.ClientSession.request')
-    def test_workflow_with_task_failure(self, mock_request):
+    async def test_workflow_with_task_failure(self, mock_request, tmp_path):
         """Test workflow execution with task failure."""
         # Mock HTTP failure
         http_response = AsyncMock()
         http_response.status = 500
-        http_response.text = AsyncMock(return_value="Internal Server Error")
+        http_response.read = AsyncMock(return_value=b"Internal Server Error")
+        http_response.content_type = "text/plain"
+        http_response.get_encoding = Mock(return_value="utf-8")
         http_response.url = "https://api.example.com/api/data"
         http_response.headers = {}
         mock_request.return_value.__aenter__.return_value = http_response
@@ -149,33 +151,28 @@ class TestLeadAgentIntegration:
         # Create workflow configuration
         config_data = self.create_test_workflow_config()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            config_path = f.name
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(orjson.dumps(config_data))
         
-        try:
-            # Execute workflow
-            lead_agent = LeadAgent()
-            result = asyncio.run(lead_agent.execute_workflow_from_file(config_path))
-            
-            # Verify failure results
-            assert result.status == WorkflowStatus.FAILED
-            assert result.completed_tasks == 0
-            assert result.failed_tasks == 1  # Only first task failed
-            assert result.total_tasks == 2
-            
-            # Verify error information
-            assert "fetch_data" in result.errors
-            assert "HTTP 500" in result.errors["fetch_data"]
-            
-            # Second task should not have run
-            assert "process_data" not in result.results
-            assert "process_data" not in result.errors
-            
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        # Execute workflow
+        lead_agent = LeadAgent()
+        result = await lead_agent.execute_workflow_from_file(config_path)
+        
+        # Verify failure results
+        assert result.status == WorkflowStatus.FAILED
+        assert result.completed_tasks == 0
+        assert result.failed_tasks == 1  # Only first task failed
+        assert result.total_tasks == 2
+        
+        # Verify error information
+        assert "fetch_data" in result.errors
+        assert "HTTP 500" in result.errors["fetch_data"]
+        
+        # Second task should not have run
+        assert "process_data" not in result.results
+        assert "process_data" not in result.errors
     
-    def test_workflow_from_dict(self):
+    async def test_workflow_from_dict(self):
         """Test executing workflow from dictionary configuration."""
         config_data = {
             "name": "dict_workflow",
@@ -206,16 +203,48 @@ class TestLeadAgentIntegration:
             
             # Execute workflow
             lead_agent = LeadAgent()
-            result = asyncio.run(lead_agent.execute_workflow_from_dict(config_data))
+            result = await lead_agent.execute_workflow_from_dict(config_data)
             
             # Verify results
             assert result.status == WorkflowStatus.COMPLETED
             assert result.completed_tasks == 1
             assert result.failed_tasks == 0
-    
+
+    @patch('aiohttp.ClientSession.post')
+    async def test_workflow_from_config_object(self, mock_post):
+        """Test executing workflow from an in-memory WorkflowConfig."""
+        config = ConfigLoader.load_from_dict({
+            "name": "in_memory_workflow",
+            "agents": [
+                {
+                    "name": "test_agent",
+                    "type": "ai_agent",
+                    "endpoint": "https://api.example.com"
+                }
+            ],
+            "tasks": [
+                {
+                    "name": "simple_task",
+                    "agent_name": "test_agent",
+                    "action": "test_action"
+                }
+            ]
+        })
+
+        ai_response = AsyncMock()
+        ai_response.status = 200
+        ai_response.json = AsyncMock(return_value={"result": "success"})
+        mock_post.return_value.__aenter__.return_value = ai_response
+
+        lead_agent = LeadAgent()
+        result = await lead_agent.execute_workflow(config)
+
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.results["simple_task"] == {"result": "success"}
+
     @patch('aiohttp.ClientSession.request')
     @patch('aiohttp.ClientSession.post')
-    def test_parallel_workflow_execution(self, mock_post, mock_request):
+    async def test_parallel_workflow_execution(self, mock_post, mock_request, tmp_path):
         """Test parallel workflow execution."""
         # Create parallel workflow configuration
         config_data = {
@@ -256,7 +285,8 @@ class TestLeadAgentIntegration:
         # Mock responses
         http_response = AsyncMock()
         http_response.status = 200
-        http_response.json = AsyncMock(return_value={"data": "http_data"})
+        http_response.read = AsyncMock(return_value=orjson.dumps({"data": "http_data"}))
+        http_response.content_type = "application/json"
         http_response.url = "https://api.example.com/data"
         http_response.headers = {}
         mock_request.return_value.__aenter__.return_value = http_response
@@ -266,33 +296,28 @@ class TestLeadAgentIntegration:
         ai_response.json = AsyncMock(return_value={"text": "Hello world"})
         mock_post.return_value.__aenter__.return_value = ai_response
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(config_data, Dumper=_YamlDumper))
         
-        try:
-            # Execute workflow
-            lead_agent = LeadAgent()
-            result = asyncio.run(lead_agent.execute_workflow_from_file(config_path))
-            
-            # Verify parallel execution results
-            assert result.status == WorkflowStatus.COMPLETED
-            assert result.completed_tasks == 2
-            assert result.failed_tasks == 0
-            assert result.total_tasks == 2
-            
-            # Both tasks should have results
-            assert "fetch_task" in result.results
-            assert "ai_task" in result.results
-            
-            # Both agents should have been called
-            assert mock_request.call_count >= 1
-            assert mock_post.call_count >= 1
-            
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        # Execute workflow
+        lead_agent = LeadAgent()
+        result = await lead_agent.execute_workflow_from_file(config_path)
+        
+        # Verify parallel execution results
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.completed_tasks == 2
+        assert result.failed_tasks == 0
+        assert result.total_tasks == 2
+        
+        # Both tasks should have results
+        assert "fetch_task" in result.results
+        assert "ai_task" in result.results
+        
+        # Both agents should have been called
+        assert mock_request.call_count >= 1
+        assert mock_post.call_count >= 1
     
-    def test_invalid_configuration_handling(self):
+    async def test_invalid_configuration_handling(self, tmp_path):
         """Test handling of invalid workflow configuration."""
         # Invalid configuration missing required fields
         invalid_config = {
@@ -300,40 +325,39 @@ class TestLeadAgentIntegration:
             # Missing agents and tasks
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(invalid_config, f)
-            config_path = f.name
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(orjson.dumps(invalid_config))
         
-        try:
-            lead_agent = LeadAgent()
+        lead_agent = LeadAgent()
+        
+        # Should raise an exception during loading
+        with pytest.raises(Exception):
+            await lead_agent.execute_workflow_from_file(config_path)
             
-            # Should raise an exception during loading
-            with pytest.raises(Exception):
-                asyncio.run(lead_agent.execute_workflow_from_file(config_path))
-                
-        finally:
-            Path(config_path).unlink(missing_ok=True)
     
-    def test_nonexistent_configuration_file(self):
+    async def test_nonexistent_configuration_file(self):
         """Test handling of non-existent configuration file."""
         lead_agent = LeadAgent()
         
         with pytest.raises(Exception):
-            asyncio.run(lead_agent.execute_workflow_from_file("/nonexistent/file.yaml"))
+            await lead_agent.execute_workflow_from_file("/nonexistent/file.yaml")
     
     @patch('aiohttp.ClientSession.request')
-    def test_retry_mechanism_integration(self, mock_request):
+    async def test_retry_mechanism_integration(self, mock_request, tmp_path):
         """Test retry mechanism in integration scenario."""
         # Mock responses: first call fails, second succeeds
         failure_response = AsyncMock()
         failure_response.status = 500
-        failure_response.text = AsyncMock(return_value="Server Error")
+        failure_response.read = AsyncMock(return_value=b"Server Error")
+        failure_response.content_type = "text/plain"
+        failure_response.get_encoding = Mock(return_value="utf-8")
         failure_response.url = "https://api.example.com/data"
         failure_response.headers = {}
         
         success_response = AsyncMock()
         success_response.status = 200
-        success_response.json = AsyncMock(return_value={"data": "retry_success"})
+        success_response.read = AsyncMock(return_value=orjson.dumps({"data": "retry_success"}))
+        success_response.content_type = "application/json"
         success_response.url = "https://api.example.com/data"
         success_response.headers = {}
         
@@ -365,32 +389,27 @@ class TestLeadAgentIntegration:
             ]
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = f.name
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(config_data, Dumper=_YamlDumper))
         
-        try:
-            # Execute workflow
-            lead_agent = LeadAgent()
-            result = asyncio.run(lead_agent.execute_workflow_from_file(config_path))
-            
-            # Should succeed after retry
-            assert result.status == WorkflowStatus.COMPLETED
-            assert result.completed_tasks == 1
-            assert result.failed_tasks == 0
-            assert result.results["retry_task"] == {"data": "retry_success"}
-            
-            # Should have been called twice (original + retry)
-            assert mock_request.call_count == 2
-            
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+        # Execute workflow
+        lead_agent = LeadAgent()
+        result = await lead_agent.execute_workflow_from_file(config_path)
+        
+        # Should succeed after retry
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.completed_tasks == 1
+        assert result.failed_tasks == 0
+        assert result.results["retry_task"] == {"data": "retry_success"}
+        
+        # Should have been called twice (original + retry)
+        assert mock_request.call_count == 2
 
 
 class TestWorkflowEngineIntegration:
     """Integration tests for WorkflowEngine specifically."""
     
-    def test_engine_lifecycle(self):
+    async def test_engine_lifecycle(self, tmp_path):
         """Test complete engine lifecycle."""
         engine = WorkflowEngine()
         
@@ -418,36 +437,31 @@ class TestWorkflowEngineIntegration:
             ]
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            config_path = f.name
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(orjson.dumps(config_data))
+        
+        # Load workflow
+        await engine.load_workflow(config_path)
+        
+        # Verify loading
+        assert engine.workflow_config is not None
+        assert engine.workflow_config.name == "lifecycle_test"
+        assert len(engine.agents) == 1
+        assert "test_agent" in engine.agents
+        assert engine.task_executor is not None
         
-        try:
-            # Load workflow
-            asyncio.run(engine.load_workflow(config_path))
+        # Mock the agent execution
+        with patch.object(engine.agents["test_agent"], 'execute_with_resilience') as mock_execute:
+            mock_execute.return_value = AgentResponse(success=True, result="test_result")
             
-            # Verify loading
-            assert engine.workflow_config is not None
-            assert engine.workflow_config.name == "lifecycle_test"
-            assert len(engine.agents) == 1
-            assert "test_agent" in engine.agents
-            assert engine.task_executor is not None
+            # Execute workflow
+            result = await engine.execute_workflow()
+            
+            # Verify execution
+            assert result.status == WorkflowStatus.COMPLETED
+            assert result.completed_tasks == 1
+            assert result.failed_tasks == 0
+            assert result.results["test_task"] == "test_result"
             
-            # Mock the agent execution
-            with patch.object(engine.agents["test_agent"], 'execute_with_resilience') as mock_execute:
-                mock_execute.return_value = AgentResponse(success=True, result="test_result")
-                
-                # Execute workflow
-                result = asyncio.run(engine.execute_workflow())
-                
-                # Verify execution
-                assert result.status == WorkflowStatus.COMPLETED
-                assert result.completed_tasks == 1
-                assert result.failed_tasks == 0
-                assert result.results["test_task"] == "test_result"
-                
-                # Verify agent was called
-                mock_execute.assert_called_once_with("test_action", {})
-                
-        finally:
-            Path(config_path).unlink(missing_ok=True)
+            # Verify agent was called
+            mock_execute.assert_called_once_with("test_action", {})
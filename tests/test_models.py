@@ -10,6 +10,9 @@ from src.lead_agent.models import (
     AgentResponse, WorkflowResult
 )
 
+# Timestamp for round-trip tests, fixed so they do not depend on the clock
+FIXED_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class TestRetryConfig:
     """Test RetryConfig model."""
@@ -38,26 +41,17 @@ class TestRetryConfig:
         assert config.exponential_base == 1.5
         assert config.jitter is False
     
-    def test_validation_constraints(self):
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param({"max_attempts": 0}, id="max_attempts_below_1"),
+        pytest.param({"max_attempts": 11}, id="max_attempts_above_10"),
+        pytest.param({"initial_delay": 0.05}, id="initial_delay_below_0.1"),
+        pytest.param({"max_delay": 0.5}, id="max_delay_below_1.0"),
+        pytest.param({"exponential_base": 1.0}, id="exponential_base_below_1.1"),
+    ])
+    def test_validation_constraints(self, kwargs):
         """Test validation constraints."""
-        # max_attempts must be >= 1 and <= 10
-        with pytest.raises(ValidationError):
-            RetryConfig(max_attempts=0)
-        
-        with pytest.raises(ValidationError):
-            RetryConfig(max_attempts=11)
-        
-        # initial_delay must be >= 0.1
-        with pytest.raises(ValidationError):
-            RetryConfig(initial_delay=0.05)
-        
-        # max_delay must be >= 1.0
         with pytest.raises(ValidationError):
-            RetryConfig(max_delay=0.5)
-        
-        # exponential_base must be >= 1.1
-        with pytest.raises(ValidationError):
-            RetryConfig(exponential_base=1.0)
+            RetryConfig(**kwargs)
 
 
 class TestCircuitBreakerConfig:
@@ -81,15 +75,14 @@ class TestCircuitBreakerConfig:
         assert config.recovery_timeout == 30.0
         assert config.expected_exception == "TimeoutError"
     
-    def test_validation_constraints(self):
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param({"failure_threshold": 0}, id="failure_threshold_below_1"),
+        pytest.param({"recovery_timeout": 0.5}, id="recovery_timeout_below_1.0"),
+    ])
+    def test_validation_constraints(self, kwargs):
         """Test validation constraints."""
-        # failure_threshold must be >= 1
-        with pytest.raises(ValidationError):
-            CircuitBreakerConfig(failure_threshold=0)
-        
-        # recovery_timeout must be >= 1.0
         with pytest.raises(ValidationError):
-            CircuitBreakerConfig(recovery_timeout=0.5)
+            CircuitBreakerConfig(**kwargs)
 
 
 class TestAgentConfig:
@@ -127,6 +120,16 @@ class TestAgentConfig:
         assert config.retry_config.max_attempts == 5
         assert config.circuit_breaker.failure_threshold == 3
         assert config.custom_params == {"version": "v1"}
+    
+    def test_config_is_frozen(self):
+        """Test that agent configuration cannot be mutated."""
+        config = AgentConfig(name="test_agent", type=AgentType.AI_AGENT)
+        
+        with pytest.raises(ValidationError):
+            config.endpoint = "https://api.example.com"
+        
+        with pytest.raises(ValidationError):
+            config.retry_config.max_attempts = 5
 
 
 class TestTaskConfig:
@@ -225,6 +228,27 @@ class TestWorkflowConfig:
                 agents=[agent],
                 failure_strategy="invalid_strategy"
             )
+    
+    def test_dependency_graph(self):
+        """Test the cached compressed dependency graph."""
+        agent = AgentConfig(name="agent1", type=AgentType.AI_AGENT)
+        config = WorkflowConfig(
+            name="test_workflow",
+            tasks=[
+                TaskConfig(name="a", agent_name="agent1", action="action"),
+                TaskConfig(name="b", agent_name="agent1", action="action", depends_on=["a"]),
+                TaskConfig(name="c", agent_name="agent1", action="action", depends_on=["a", "b", "missing"])
+            ],
+            agents=[agent]
+        )
+        
+        graph = config.dependency_graph
+        
+        assert graph is config.dependency_graph
+        assert graph.names == ["a", "b", "c"]
+        assert list(graph.in_degree) == [0, 1, 2]
+        assert list(graph.offsets) == [0, 2, 3, 3]
+        assert list(graph.dependents) == [1, 2, 2]
 
 
 class TestTaskExecution:
@@ -254,7 +278,7 @@ class TestTaskExecution:
     
     def test_custom_values(self):
         """Test custom execution values."""
-        now = datetime.now(timezone.utc)
+        now = FIXED_TIME
         execution = TaskExecution(
             task_id="custom-id",
             name="test_task",
@@ -300,7 +324,7 @@ class TestWorkflowExecution:
     
     def test_custom_values(self):
         """Test custom execution values."""
-        now = datetime.now(timezone.utc)
+        now = FIXED_TIME
         task = TaskExecution(name="task1", agent_name="agent1", action="action1")
         
         execution = WorkflowExecution(
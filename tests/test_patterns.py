@@ -1,17 +1,46 @@
 """Tests for design patterns."""
 
 import asyncio
-import time
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from src.lead_agent.models import CircuitBreakerConfig, RetryConfig
+from src.lead_agent.patterns import circuit_breaker, retry
 from src.lead_agent.patterns.circuit_breaker import CircuitBreaker, CircuitBreakerState
 from src.lead_agent.patterns.retry import RetryHandler, RetryExhaustedException
 from src.lead_agent.patterns.observer import Observer, Subject
 
 
+class ManualClock:
+    """Monotonic clock that only moves when advanced."""
+    
+    def __init__(self):
+        self.now_ns = 0
+    
+    def monotonic_ns(self) -> int:
+        return self.now_ns
+    
+    def advance(self, seconds: float) -> None:
+        self.now_ns += int(seconds * 1_000_000_000)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the circuit breaker from a manual clock instead of sleeping."""
+    manual_clock = ManualClock()
+    monkeypatch.setattr(circuit_breaker, "time", manual_clock)
+    return manual_clock
+
+
+@pytest.fixture
+def backoff_sleep(monkeypatch):
+    """Record retry backoff sleeps instead of waiting them out."""
+    sleep = AsyncMock(return_value=None)
+    monkeypatch.setattr(retry.asyncio, "sleep", sleep)
+    return sleep
+
+
 class TestCircuitBreaker:
     """Test CircuitBreaker class."""
     
@@ -77,7 +106,7 @@ class TestCircuitBreaker:
         # Should not allow execution
         assert cb.can_execute() is False
     
-    def test_transition_to_half_open(self):
+    def test_transition_to_half_open(self, clock):
         """Test transition from open to half-open state."""
         config = CircuitBreakerConfig(failure_threshold=1, recovery_timeout=1.0)
         cb = CircuitBreaker(config)
@@ -87,21 +116,21 @@ class TestCircuitBreaker:
         assert cb.state == CircuitBreakerState.OPEN
         
         # Wait for recovery timeout
-        time.sleep(1.1)
+        clock.advance(1.1)
         
         # Should transition to half-open
         assert cb.can_execute() is True
         assert cb.state == CircuitBreakerState.HALF_OPEN
         assert cb.is_half_open is True
     
-    def test_half_open_success_closes_circuit(self):
+    def test_half_open_success_closes_circuit(self, clock):
         """Test that success in half-open state closes circuit."""
         config = CircuitBreakerConfig(failure_threshold=1, recovery_timeout=1.0)
         cb = CircuitBreaker(config)
         
         # Open the circuit and transition to half-open
         cb.record_failure()
-        time.sleep(1.1)
+        clock.advance(1.1)
         cb.can_execute()  # Transitions to half-open
         
         assert cb.state == CircuitBreakerState.HALF_OPEN
@@ -112,14 +141,14 @@ class TestCircuitBreaker:
         assert cb.failure_count == 0
         assert cb.last_failure_time is None
     
-    def test_half_open_failure_opens_circuit(self):
+    def test_half_open_failure_opens_circuit(self, clock):
         """Test that failure in half-open state opens circuit."""
         config = CircuitBreakerConfig(failure_threshold=1, recovery_timeout=1.0)
         cb = CircuitBreaker(config)
         
         # Open the circuit and transition to half-open
         cb.record_failure()
-        time.sleep(1.1)
+        clock.advance(1.1)
         cb.can_execute()  # Transitions to half-open
         
         assert cb.state == CircuitBreakerState.HALF_OPEN
@@ -132,45 +161,46 @@ class TestCircuitBreaker:
 class TestRetryHandler:
     """Test RetryHandler class."""
     
-    def test_successful_execution_no_retry(self):
+    async def test_successful_execution_no_retry(self):
         """Test successful execution without retry."""
         config = RetryConfig(max_attempts=3, initial_delay=0.1)
         handler = RetryHandler(config)
         
         mock_func = Mock(return_value="success")
         
-        result = asyncio.run(handler.execute_with_retry(mock_func, "arg1", kwarg1="value1"))
+        result = await handler.execute_with_retry(mock_func, "arg1", kwarg1="value1")
         
         assert result == "success"
         assert mock_func.call_count == 1
         mock_func.assert_called_with("arg1", kwarg1="value1")
     
-    def test_successful_async_execution_no_retry(self):
+    async def test_successful_async_execution_no_retry(self):
         """Test successful async execution without retry."""
         config = RetryConfig(max_attempts=3, initial_delay=0.1)
         handler = RetryHandler(config)
         
         mock_func = AsyncMock(return_value="async_success")
         
-        result = asyncio.run(handler.execute_with_retry(mock_func, "arg1", kwarg1="value1"))
+        result = await handler.execute_with_retry(mock_func, "arg1", kwarg1="value1")
         
         assert result == "async_success"
         assert mock_func.call_count == 1
         mock_func.assert_called_with("arg1", kwarg1="value1")
     
-    def test_retry_on_failure(self):
+    async def test_retry_on_failure(self, backoff_sleep):
         """Test retry behavior on failure."""
         config = RetryConfig(max_attempts=3, initial_delay=0.1, jitter=False)
         handler = RetryHandler(config)
         
         mock_func = Mock(side_effect=[Exception("error1"), Exception("error2"), "success"])
         
-        result = asyncio.run(handler.execute_with_retry(mock_func))
+        result = await handler.execute_with_retry(mock_func)
         
         assert result == "success"
         assert mock_func.call_count == 3
+        assert [c.args[0] for c in backoff_sleep.call_args_list] == pytest.approx([0.1, 0.2])
     
-    def test_retry_exhausted(self):
+    async def test_retry_exhausted(self, backoff_sleep):
         """Test retry exhausted scenario."""
         config = RetryConfig(max_attempts=2, initial_delay=0.1)
         handler = RetryHandler(config)
@@ -178,11 +208,13 @@ class TestRetryHandler:
         mock_func = Mock(side_effect=Exception("persistent_error"))
         
         with pytest.raises(RetryExhaustedException) as exc_info:
-            asyncio.run(handler.execute_with_retry(mock_func))
+            await handler.execute_with_retry(mock_func)
         
         assert "All 2 retry attempts failed" in str(exc_info.value)
         assert "persistent_error" in str(exc_info.value)
         assert mock_func.call_count == 2
+        # No backoff after the final attempt
+        assert backoff_sleep.await_count == 1
     
     def test_delay_calculation_without_jitter(self):
         """Test delay calculation without jitter."""
@@ -215,6 +247,20 @@ class TestRetryHandler:
         delay = handler._calculate_delay(1)  # Base would be 2.0
         assert 1.8 <= delay <= 2.2  # 2.0 ± 10%
     
+    def test_delay_schedule_precomputed(self):
+        """Test that the backoff schedule is computed once per handler."""
+        config = RetryConfig(
+            max_attempts=4,
+            initial_delay=0.5,
+            exponential_base=2.0,
+            max_delay=3.0,
+            jitter=False
+        )
+        handler = RetryHandler(config)
+        
+        assert handler._delays == (0.5, 1.0, 2.0, 3.0)
+        assert handler._calculate_delay(2) == 2.0
+    
     def test_max_delay_enforcement(self):
         """Test that delays are capped at max_delay."""
         config = RetryConfig(
@@ -270,7 +316,7 @@ class TestObserver:
         subject.detach(observer)
         assert len(subject._observers) == 0
     
-    def test_notify_observers(self):
+    async def test_notify_observers(self):
         """Test notifying observers."""
         subject = Subject()
         observer1 = MockObserver()
@@ -280,7 +326,7 @@ class TestObserver:
         subject.attach(observer2)
         
         # Notify with event
-        asyncio.run(subject.notify("test_event", {"data": "test"}))
+        await subject.notify("test_event", {"data": "test"})
         
         # Check both observers received the event
         assert len(observer1.events) == 1
@@ -297,7 +343,7 @@ class TestObserver:
         assert event2[1] == "test_event"
         assert event2[2] == {"data": "test"}
     
-    def test_notify_with_failing_observer(self):
+    async def test_notify_with_failing_observer(self):
         """Test that notification continues even if one observer fails."""
         subject = Subject()
         
@@ -314,9 +360,55 @@ class TestObserver:
         subject.attach(failing_observer)
         
         # Notify should not raise exception
-        asyncio.run(subject.notify("test_event", "test_data"))
+        await subject.notify("test_event", "test_data")
         
         # Good observer should still receive the event
         assert len(good_observer.events) == 1
         assert good_observer.events[0][1] == "test_event"
         assert good_observer.events[0][2] == "test_data"
+    
+    async def test_notify_in_attach_order(self):
+        """Test that observers are notified in attach order until detached."""
+        subject = Subject()
+        calls = []
+        
+        class RecordingObserver(Observer):
+            def __init__(self, name):
+                self.name = name
+            
+            async def update(self, subject: Subject, event_type: str, data: any) -> None:
+                calls.append(self.name)
+        
+        first, second, third = (RecordingObserver(name) for name in ("first", "second", "third"))
+        for observer in (first, second, third):
+            subject.attach(observer)
+        
+        await subject.notify("test_event")
+        assert calls == ["first", "second", "third"]
+        
+        calls.clear()
+        subject.detach(second)
+        await subject.notify("test_event")
+        assert calls == ["first", "third"]
+    
+    async def test_notify_observers_concurrently(self):
+        """Test that a waiting observer does not block the others."""
+        subject = Subject()
+        released = []
+        
+        class WaitingObserver(Observer):
+            async def update(self, subject: Subject, event_type: str, data: any) -> None:
+                await asyncio.wait_for(data.wait(), timeout=1)
+                released.append("waiting")
+        
+        class ReleasingObserver(Observer):
+            async def update(self, subject: Subject, event_type: str, data: any) -> None:
+                data.set()
+                released.append("releasing")
+        
+        subject.attach(WaitingObserver())
+        subject.attach(ReleasingObserver())
+        
+        await subject.notify("test_event", asyncio.Event())
+        
+        assert released == ["releasing", "waiting"]
@@ -1,20 +1,22 @@
 """Tests for workflow components."""
 
 import asyncio
-from datetime import datetime
-from unittest.mock import AsyncMock, Mock
+import uuid
 
 import pytest
 
 from src.lead_agent.models import (
     TaskExecution, TaskStatus, WorkflowExecution, WorkflowStatus,
-    AgentResponse, AgentConfig, AgentType
+    AgentResponse, AgentConfig, AgentType, TaskConfig, WorkflowConfig
 )
 from src.lead_agent.workflow.state_machine import WorkflowStateMachine
 from src.lead_agent.workflow.executor import TaskExecutor
-from src.lead_agent.workflow.engine import WorkflowEngine
+from src.lead_agent.workflow.engine import WorkflowEngine, _batch_uuids
 from src.lead_agent.agents.base import BaseAgent
 
+# Shared read-only agent configuration; AgentConfig is frozen
+_AGENT_CONFIG = AgentConfig(name="test_agent", type=AgentType.AI_AGENT)
+
 
 class MockAgent(BaseAgent):
     """Mock agent for testing."""
@@ -46,41 +48,38 @@ class TestWorkflowStateMachine:
         assert sm.workflow_execution is workflow
         assert workflow.status == WorkflowStatus.PENDING
     
-    def test_start_workflow(self):
+    async def test_start_workflow(self):
         """Test starting workflow execution."""
         workflow = WorkflowExecution(name="test_workflow")
         sm = WorkflowStateMachine(workflow)
         
-        asyncio.run(sm.start_workflow())
+        await sm.start_workflow()
         
         assert workflow.status == WorkflowStatus.RUNNING
         assert workflow.start_time is not None
     
-    def test_start_workflow_invalid_state(self):
+    async def test_start_workflow_invalid_state(self):
         """Test starting workflow in invalid state."""
         workflow = WorkflowExecution(name="test_workflow", status=WorkflowStatus.RUNNING)
         sm = WorkflowStateMachine(workflow)
         
-        with pytest.raises(ValueError) as exc_info:
-            asyncio.run(sm.start_workflow())
-        
-        assert "not in pending state" in str(exc_info.value)
+        with pytest.raises(ValueError, match="not in pending state"):
+            await sm.start_workflow()
     
-    def test_start_task(self):
+    async def test_start_task(self):
         """Test starting task execution."""
-        workflow = WorkflowExecution(name="test_workflow")
         task = TaskExecution(name="test_task", agent_name="test_agent", action="test_action")
-        workflow.tasks.append(task)
+        workflow = WorkflowExecution(name="test_workflow", tasks=[task])
         
         sm = WorkflowStateMachine(workflow)
         
-        asyncio.run(sm.start_task(task))
+        await sm.start_task(task)
         
         assert task.status == TaskStatus.RUNNING
         assert task.start_time is not None
         assert task.attempts == 1
     
-    def test_start_task_invalid_state(self):
+    async def test_start_task_invalid_state(self):
         """Test starting task in invalid state."""
         workflow = WorkflowExecution(name="test_workflow")
         task = TaskExecution(
@@ -92,26 +91,23 @@ class TestWorkflowStateMachine:
         
         sm = WorkflowStateMachine(workflow)
         
-        with pytest.raises(ValueError) as exc_info:
-            asyncio.run(sm.start_task(task))
-        
-        assert "not in pending state" in str(exc_info.value)
+        with pytest.raises(ValueError, match="not in pending state"):
+            await sm.start_task(task)
     
-    def test_complete_task(self):
+    async def test_complete_task(self):
         """Test completing task execution."""
-        workflow = WorkflowExecution(name="test_workflow", total_tasks=1)
         task = TaskExecution(
             name="test_task",
             agent_name="test_agent",
             action="test_action",
             status=TaskStatus.RUNNING
         )
-        workflow.tasks.append(task)
+        workflow = WorkflowExecution(name="test_workflow", total_tasks=1, tasks=[task])
         
         sm = WorkflowStateMachine(workflow)
-        asyncio.run(sm.start_workflow())
+        await sm.start_workflow()
         
-        asyncio.run(sm.complete_task(task, "test_result"))
+        await sm.complete_task(task, "test_result")
         
         assert task.status == TaskStatus.COMPLETED
         assert task.end_time is not None
@@ -119,9 +115,8 @@ class TestWorkflowStateMachine:
         assert workflow.status == WorkflowStatus.COMPLETED
         assert workflow.completed_tasks == 1
     
-    def test_fail_task_with_retries(self):
+    async def test_fail_task_with_retries(self):
         """Test failing task with retry attempts remaining."""
-        workflow = WorkflowExecution(name="test_workflow")
         task = TaskExecution(
             name="test_task",
             agent_name="test_agent",
@@ -130,19 +125,18 @@ class TestWorkflowStateMachine:
             attempts=1,
             max_attempts=3
         )
-        workflow.tasks.append(task)
+        workflow = WorkflowExecution(name="test_workflow", tasks=[task])
         
         sm = WorkflowStateMachine(workflow)
         
-        asyncio.run(sm.fail_task(task, "test_error"))
+        await sm.fail_task(task, "test_error")
         
         assert task.status == TaskStatus.RETRYING
         assert task.error == "test_error"
         assert task.end_time is not None
     
-    def test_fail_task_exhausted_retries(self):
+    async def test_fail_task_exhausted_retries(self):
         """Test failing task with no retry attempts remaining."""
-        workflow = WorkflowExecution(name="test_workflow", total_tasks=1)
         task = TaskExecution(
             name="test_task",
             agent_name="test_agent",
@@ -151,99 +145,193 @@ class TestWorkflowStateMachine:
             attempts=3,
             max_attempts=3
         )
-        workflow.tasks.append(task)
+        workflow = WorkflowExecution(name="test_workflow", total_tasks=1, tasks=[task])
         
         sm = WorkflowStateMachine(workflow)
-        asyncio.run(sm.start_workflow())
+        await sm.start_workflow()
         
-        asyncio.run(sm.fail_task(task, "test_error"))
+        await sm.fail_task(task, "test_error")
         
         assert task.status == TaskStatus.FAILED
         assert task.error == "test_error"
         assert workflow.status == WorkflowStatus.FAILED
     
+    async def test_fail_task_continue_on_failure(self):
+        """Test that a task allowed to fail does not fail the workflow."""
+        task1 = TaskExecution(
+            name="task1",
+            agent_name="agent1",
+            action="action1",
+            status=TaskStatus.RUNNING,
+            attempts=3,
+            max_attempts=3,
+            continue_on_failure=True
+        )
+        task2 = TaskExecution(name="task2", agent_name="agent2", action="action2")
+        workflow = WorkflowExecution(name="test_workflow", total_tasks=2, tasks=[task1, task2])
+        
+        sm = WorkflowStateMachine(workflow)
+        await sm.start_workflow()
+        
+        await sm.fail_task(task1, "test_error")
+        
+        assert task1.status == TaskStatus.FAILED
+        assert workflow.status == WorkflowStatus.RUNNING
+        assert sm.get_ready_tasks() == [task2]
+    
     def test_get_ready_tasks(self):
         """Test getting ready tasks."""
-        workflow = WorkflowExecution(name="test_workflow")
-        
         task1 = TaskExecution(name="task1", agent_name="agent1", action="action1")
         task2 = TaskExecution(name="task2", agent_name="agent2", action="action2")
         task3 = TaskExecution(name="task3", agent_name="agent3", action="action3", status=TaskStatus.RUNNING)
         
-        workflow.tasks.extend([task1, task2, task3])
+        workflow = WorkflowExecution(name="test_workflow", tasks=[task1, task2, task3])
         
         sm = WorkflowStateMachine(workflow)
         ready_tasks = sm.get_ready_tasks()
         
         # Only pending tasks with satisfied dependencies should be ready
-        assert len(ready_tasks) == 2
-        assert task1 in ready_tasks
-        assert task2 in ready_tasks
-        assert task3 not in ready_tasks
+        assert ready_tasks == [task1, task2]
+    
+    async def test_get_ready_tasks_after_dependencies_complete(self):
+        """Test that tasks become ready once all their dependencies complete."""
+        task1 = TaskExecution(name="task1", agent_name="agent1", action="action1")
+        task2 = TaskExecution(name="task2", agent_name="agent1", action="action2")
+        task3 = TaskExecution(name="task3", agent_name="agent1", action="action3", depends_on=["task1", "task2"])
+        task4 = TaskExecution(name="task4", agent_name="agent1", action="action4", depends_on=["undefined"])
+        
+        workflow = WorkflowExecution(name="test_workflow", tasks=[task1, task2, task3, task4])
+        
+        sm = WorkflowStateMachine(workflow)
+        assert sm.get_ready_tasks() == [task1, task2]
+        
+        async def run_task(task):
+            await sm.start_task(task)
+            await sm.complete_task(task, "done")
+        
+        await run_task(task1)
+        assert sm.get_ready_tasks() == [task2]
+        assert not sm.dependencies_satisfied(task3)
+        
+        await run_task(task2)
+        assert sm.get_ready_tasks() == [task3]
+        assert sm.dependencies_satisfied(task3)
+        assert not sm.dependencies_satisfied(task4)
+    
+    def test_get_ready_tasks_critical_path_first(self):
+        """Test that ready tasks heading longer chains are returned first."""
+        short = TaskExecution(name="short", agent_name="agent1", action="action", timeout=50)
+        head = TaskExecution(name="head", agent_name="agent1", action="action", timeout=10)
+        middle = TaskExecution(name="middle", agent_name="agent1", action="action", timeout=30, depends_on=["head"])
+        tail = TaskExecution(name="tail", agent_name="agent1", action="action", timeout=30, depends_on=["middle"])
+        
+        workflow = WorkflowExecution(name="test_workflow", tasks=[short, head, middle, tail])
+        
+        sm = WorkflowStateMachine(workflow)
+        
+        assert sm.get_ready_tasks() == [head, short]
+        assert sm.sort_by_priority([short, tail, middle]) == [middle, short, tail]
     
     def test_get_retryable_tasks(self):
         """Test getting retryable tasks."""
-        workflow = WorkflowExecution(name="test_workflow")
-        
         task1 = TaskExecution(name="task1", agent_name="agent1", action="action1", status=TaskStatus.PENDING)
         task2 = TaskExecution(name="task2", agent_name="agent2", action="action2", status=TaskStatus.RETRYING)
         task3 = TaskExecution(name="task3", agent_name="agent3", action="action3", status=TaskStatus.FAILED)
         
-        workflow.tasks.extend([task1, task2, task3])
+        workflow = WorkflowExecution(name="test_workflow", tasks=[task1, task2, task3])
         
         sm = WorkflowStateMachine(workflow)
         retryable_tasks = sm.get_retryable_tasks()
         
-        assert len(retryable_tasks) == 1
-        assert task2 in retryable_tasks
+        assert retryable_tasks == [task2]
     
-    def test_complete_workflow_all_completed(self):
-        """Test completing workflow when all tasks are completed."""
-        workflow = WorkflowExecution(name="test_workflow", total_tasks=2, status=WorkflowStatus.RUNNING)
+    @pytest.mark.asyncio
+    async def test_get_retryable_tasks_tracks_transitions(self):
+        """Test that retryable tasks follow status transitions."""
+        task1 = TaskExecution(name="task1", agent_name="agent1", action="action1", max_attempts=2)
+        task2 = TaskExecution(name="task2", agent_name="agent2", action="action2")
+        
+        workflow = WorkflowExecution(name="test_workflow", status=WorkflowStatus.RUNNING, tasks=[task1, task2])
+        
+        sm = WorkflowStateMachine(workflow)
+        await sm.start_task(task1)
+        await sm.fail_task(task1, "boom")
+        
+        assert sm.get_retryable_tasks() == [task1]
         
+        await sm.start_task(task1)
+        
+        assert sm.get_retryable_tasks() == []
+    
+    async def test_complete_workflow_all_completed(self):
+        """Test completing workflow when all tasks are completed."""
         task1 = TaskExecution(name="task1", agent_name="agent1", action="action1", status=TaskStatus.COMPLETED)
         task2 = TaskExecution(name="task2", agent_name="agent2", action="action2", status=TaskStatus.COMPLETED)
         
-        workflow.tasks.extend([task1, task2])
+        workflow = WorkflowExecution(
+            name="test_workflow",
+            total_tasks=2,
+            status=WorkflowStatus.RUNNING,
+            tasks=[task1, task2]
+        )
         
         sm = WorkflowStateMachine(workflow)
-        asyncio.run(sm.complete_workflow())
+        await sm.complete_workflow()
         
         assert workflow.status == WorkflowStatus.COMPLETED
         assert workflow.end_time is not None
         assert workflow.completed_tasks == 2
         assert workflow.failed_tasks == 0
     
-    def test_complete_workflow_partial_completion(self):
+    async def test_complete_workflow_partial_completion(self):
         """Test completing workflow with partial completion allowed."""
+        task1 = TaskExecution(name="task1", agent_name="agent1", action="action1", status=TaskStatus.COMPLETED)
+        task2 = TaskExecution(name="task2", agent_name="agent2", action="action2", status=TaskStatus.FAILED)
+        task3 = TaskExecution(name="task3", agent_name="agent3", action="action3", status=TaskStatus.COMPLETED)
+        
         workflow = WorkflowExecution(
             name="test_workflow",
             total_tasks=3,
             status=WorkflowStatus.RUNNING,
-            partial_completion_allowed=True
+            partial_completion_allowed=True,
+            tasks=[task1, task2, task3]
         )
         
+        sm = WorkflowStateMachine(workflow)
+        await sm.complete_workflow()
+        
+        assert workflow.status == WorkflowStatus.PARTIALLY_COMPLETED
+        assert workflow.completed_tasks == 2
+        assert workflow.failed_tasks == 1
+    
+    async def test_fail_workflow_records_task_counts(self):
+        """Test that failing a workflow records its final task counts."""
         task1 = TaskExecution(name="task1", agent_name="agent1", action="action1", status=TaskStatus.COMPLETED)
         task2 = TaskExecution(name="task2", agent_name="agent2", action="action2", status=TaskStatus.FAILED)
-        task3 = TaskExecution(name="task3", agent_name="agent3", action="action3", status=TaskStatus.COMPLETED)
+        task3 = TaskExecution(name="task3", agent_name="agent3", action="action3")
         
-        workflow.tasks.extend([task1, task2, task3])
+        workflow = WorkflowExecution(
+            name="test_workflow",
+            total_tasks=3,
+            status=WorkflowStatus.RUNNING,
+            tasks=[task1, task2, task3]
+        )
         
         sm = WorkflowStateMachine(workflow)
-        asyncio.run(sm.complete_workflow())
+        await sm.fail_workflow("test_error")
         
-        assert workflow.status == WorkflowStatus.PARTIALLY_COMPLETED
-        assert workflow.completed_tasks == 2
+        assert workflow.status == WorkflowStatus.FAILED
+        assert workflow.end_time is not None
+        assert workflow.completed_tasks == 1
         assert workflow.failed_tasks == 1
 
 
 class TestTaskExecutor:
     """Test TaskExecutor class."""
     
-    def test_execute_task_success(self):
+    async def test_execute_task_success(self):
         """Test successful task execution."""
-        agent_config = AgentConfig(name="test_agent", type=AgentType.AI_AGENT)
-        agent = MockAgent(agent_config, [AgentResponse(success=True, result="success_result")])
+        agent = MockAgent(_AGENT_CONFIG, [AgentResponse(success=True, result="success_result")])
         
         executor = TaskExecutor({"test_agent": agent})
         
@@ -254,13 +342,13 @@ class TestTaskExecutor:
             parameters={"param": "value"}
         )
         
-        response = asyncio.run(executor.execute_task(task))
+        response = await executor.execute_task(task)
         
         assert response.success is True
         assert response.result == "success_result"
         assert agent.call_count == 1
     
-    def test_execute_task_agent_not_found(self):
+    async def test_execute_task_agent_not_found(self):
         """Test task execution with missing agent."""
         executor = TaskExecutor({})
         
@@ -270,15 +358,14 @@ class TestTaskExecutor:
             action="test_action"
         )
         
-        response = asyncio.run(executor.execute_task(task))
+        response = await executor.execute_task(task)
         
         assert response.success is False
         assert "Agent 'missing_agent' not found" in response.error
     
-    def test_execute_task_agent_failure(self):
+    async def test_execute_task_agent_failure(self):
         """Test task execution with agent failure."""
-        agent_config = AgentConfig(name="test_agent", type=AgentType.AI_AGENT)
-        agent = MockAgent(agent_config, [AgentResponse(success=False, error="agent_error")])
+        agent = MockAgent(_AGENT_CONFIG, [AgentResponse(success=False, error="agent_error")])
         
         executor = TaskExecutor({"test_agent": agent})
         
@@ -288,20 +375,18 @@ class TestTaskExecutor:
             action="test_action"
         )
         
-        response = asyncio.run(executor.execute_task(task))
+        response = await executor.execute_task(task)
         
         assert response.success is False
         assert response.error == "agent_error"
     
-    def test_execute_task_exception(self):
+    async def test_execute_task_exception(self):
         """Test task execution with exception."""
-        agent_config = AgentConfig(name="test_agent", type=AgentType.AI_AGENT)
-        
         class FailingAgent(MockAgent):
             async def execute_with_resilience(self, action: str, parameters: dict) -> AgentResponse:
                 raise Exception("execution_exception")
         
-        agent = FailingAgent(agent_config)
+        agent = FailingAgent(_AGENT_CONFIG)
         executor = TaskExecutor({"test_agent": agent})
         
         task = TaskExecution(
@@ -310,7 +395,7 @@ class TestTaskExecutor:
             action="test_action"
         )
         
-        response = asyncio.run(executor.execute_task(task))
+        response = await executor.execute_task(task)
         
         assert response.success is False
         assert "Task execution failed: execution_exception" in response.error
@@ -334,14 +419,164 @@ class TestWorkflowEngine:
         """Test executing workflow without loading configuration."""
         engine = WorkflowEngine()
         
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="No workflow configuration loaded"):
             await engine.execute_workflow()
+    
+    @pytest.mark.asyncio
+    async def test_load_workflow_from_dict(self):
+        """Test loading a workflow directly from a dictionary."""
+        engine = WorkflowEngine()
+        
+        await engine.load_workflow_from_dict({
+            "name": "dict_workflow",
+            "agents": [{"name": "test_agent", "type": "ai_agent"}],
+            "tasks": [{"name": "task1", "agent_name": "test_agent", "action": "action1"}]
+        })
+        
+        assert engine.workflow_config.name == "dict_workflow"
+        assert set(engine.agents) == {"test_agent"}
+        assert engine.task_executor is not None
+    
+    @pytest.mark.parametrize("parallel_execution", [False, True], ids=["sequential", "parallel"])
+    async def test_failed_dependency_cancels_dependents(self, parallel_execution):
+        """Test that tasks depending on a failed task are cancelled."""
+        failing_config = AgentConfig(name="failing_agent", type=AgentType.AI_AGENT)
+        
+        engine = WorkflowEngine()
+        engine.workflow_config = WorkflowConfig(
+            name="failure_workflow",
+            parallel_execution=parallel_execution,
+            failure_strategy="partial_completion_allowed",
+            agents=[_AGENT_CONFIG, failing_config],
+            tasks=[
+                TaskConfig(
+                    name="t1", agent_name="failing_agent", action="t1",
+                    retry_config={"max_attempts": 1}
+                ),
+                TaskConfig(name="t2", agent_name="test_agent", action="t2", depends_on=["t1"]),
+                TaskConfig(name="t3", agent_name="test_agent", action="t3")
+            ]
+        )
+        engine.task_executor = TaskExecutor({
+            "test_agent": MockAgent(_AGENT_CONFIG),
+            "failing_agent": MockAgent(failing_config, [AgentResponse(success=False, error="boom")])
+        })
+        
+        result = await asyncio.wait_for(engine.execute_workflow(), timeout=5)
+        
+        statuses = {task.name: task.status for task in engine.workflow_execution.tasks}
+        assert statuses == {
+            "t1": TaskStatus.FAILED,
+            "t2": TaskStatus.CANCELLED,
+            "t3": TaskStatus.COMPLETED
+        }
+        assert result.status == WorkflowStatus.PARTIALLY_COMPLETED
+        assert result.completed_tasks == 1
+        assert result.failed_tasks == 1
+    
+    @pytest.mark.asyncio
+    async def test_parallel_execution_respects_dependencies(self):
+        """Test parallel execution runs dependency layers in order."""
+        engine = WorkflowEngine()
+        engine.workflow_config = WorkflowConfig(
+            name="diamond_workflow",
+            parallel_execution=True,
+            agents=[_AGENT_CONFIG],
+            tasks=[
+                TaskConfig(name="a", agent_name="test_agent", action="a"),
+                TaskConfig(name="b", agent_name="test_agent", action="b", depends_on=["a"]),
+                TaskConfig(name="c", agent_name="test_agent", action="c", depends_on=["a"]),
+                TaskConfig(name="d", agent_name="test_agent", action="d", depends_on=["b", "c"])
+            ]
+        )
+        engine.task_executor = TaskExecutor({"test_agent": MockAgent(_AGENT_CONFIG)})
+        
+        result = await engine.execute_workflow()
+        
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.completed_tasks == 4
+        assert engine.state_machine._graph is engine.workflow_config.dependency_graph
+        
+        tasks = {task.name: task for task in engine.workflow_execution.tasks}
+        assert tasks["b"].start_time >= tasks["a"].end_time
+        assert tasks["c"].start_time >= tasks["a"].end_time
+        assert tasks["d"].start_time >= max(tasks["b"].end_time, tasks["c"].end_time)
+    
+    @pytest.mark.asyncio
+    async def test_parallel_execution_starts_tasks_when_dependencies_finish(self):
+        """Test that a task does not wait for unrelated slower tasks."""
+        class SlowAgent(MockAgent):
+            async def execute(self, action: str, parameters: dict) -> AgentResponse:
+                await asyncio.sleep(0.2 if action == "slow" else 0)
+                return await super().execute(action, parameters)
+        
+        engine = WorkflowEngine()
+        engine.workflow_config = WorkflowConfig(
+            name="branch_workflow",
+            parallel_execution=True,
+            agents=[_AGENT_CONFIG],
+            tasks=[
+                TaskConfig(name="slow", agent_name="test_agent", action="slow"),
+                TaskConfig(name="fast", agent_name="test_agent", action="fast"),
+                TaskConfig(name="after_fast", agent_name="test_agent", action="fast", depends_on=["fast"])
+            ]
+        )
+        engine.task_executor = TaskExecutor({"test_agent": SlowAgent(_AGENT_CONFIG)})
+        
+        result = await engine.execute_workflow()
+        
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.completed_tasks == 3
+        
+        tasks = {task.name: task for task in engine.workflow_execution.tasks}
+        assert tasks["after_fast"].start_time >= tasks["fast"].end_time
+        assert tasks["after_fast"].end_time < tasks["slow"].end_time
+    
+    @pytest.mark.asyncio
+    async def test_parallel_execution_engine_error_cancels_running_tasks(self):
+        """Test that an engine error stops the tasks still in flight."""
+        cancelled = []
+        
+        engine = WorkflowEngine()
+        engine.workflow_config = WorkflowConfig(
+            name="error_workflow",
+            parallel_execution=True,
+            agents=[_AGENT_CONFIG],
+            tasks=[
+                TaskConfig(name="slow", agent_name="test_agent", action="slow"),
+                TaskConfig(name="broken", agent_name="test_agent", action="broken")
+            ]
+        )
+        engine.task_executor = TaskExecutor({"test_agent": MockAgent(_AGENT_CONFIG)})
+        
+        async def run_task(task):
+            if task.name == "broken":
+                raise RuntimeError("engine bug")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(task.name)
+                raise
+        
+        engine._run_task = run_task
+        
+        with pytest.raises(RuntimeError, match="engine bug"):
+            await engine.execute_workflow()
+        
+        assert cancelled == ["slow"]
+        assert engine.workflow_execution.status == WorkflowStatus.FAILED
+    
+    def test_batch_uuids(self):
+        """Test that batched IDs are distinct version 4 UUIDs."""
+        ids = _batch_uuids(100)
         
-        assert "No workflow configuration loaded" in str(exc_info.value)
+        assert len(set(ids)) == 100
+        assert all(uuid.UUID(value).version == 4 for value in ids)
+        assert all(uuid.UUID(value).variant == uuid.RFC_4122 for value in ids)
     
-    def test_observer_update(self):
+    async def test_observer_update(self):
         """Test observer update method."""
         engine = WorkflowEngine()
         
         # Should not raise any exceptions
-        asyncio.run(engine.update(None, "test_event", "test_data"))
+        await engine.update(None, "test_event", "test_data")